@@ -0,0 +1,40 @@
+"""Add partial indexes for active historical results and live matches
+
+Revision ID: 003_partial_indexes
+Revises: 002_api_keys
+Create Date: 2024-02-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_partial_indexes'
+down_revision: Union[str, None] = '002_api_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial indexes only cover the rows hot queries filter on
+    op.create_index(
+        'idx_historical_active',
+        'historical_results',
+        ['league_id', 'season', 'league_position'],
+        unique=False,
+        postgresql_where=sa.text('is_final = false')
+    )
+    op.create_index(
+        'idx_match_live',
+        'matches',
+        ['league_id', 'match_date'],
+        unique=False,
+        postgresql_where=sa.text("status = 'live'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_match_live', table_name='matches')
+    op.drop_index('idx_historical_active', table_name='historical_results')
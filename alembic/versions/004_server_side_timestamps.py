@@ -0,0 +1,41 @@
+"""Generate created_at/updated_at timestamps on the database server
+
+Revision ID: 004_server_timestamps
+Revises: 003_partial_indexes
+Create Date: 2024-02-05 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_server_timestamps'
+down_revision: Union[str, None] = '003_partial_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_TABLES = (
+    'leagues',
+    'teams',
+    'players',
+    'matches',
+    'match_stats',
+    'historical_results',
+)
+
+
+def upgrade() -> None:
+    # Timestamp columns are naive UTC; now() is converted to the session's
+    # TimeZone when stored into them, so take it in UTC explicitly
+    utc_now = sa.func.timezone('utc', sa.func.now())
+    for table in TIMESTAMP_TABLES:
+        op.alter_column(table, 'created_at', server_default=utc_now)
+        op.alter_column(table, 'updated_at', server_default=utc_now)
+
+
+def downgrade() -> None:
+    for table in TIMESTAMP_TABLES:
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
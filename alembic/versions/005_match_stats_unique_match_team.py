@@ -0,0 +1,37 @@
+"""Make (match_id, team_id) unique on match_stats for upserts
+
+Revision ID: 005_match_stats_unique
+Revises: 004_server_timestamps
+Create Date: 2024-02-08 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_match_stats_unique'
+down_revision: Union[str, None] = '004_server_timestamps'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest row (highest id) for each (match_id, team_id) pair,
+    # otherwise the constraint cannot be created
+    op.execute(
+        'DELETE FROM match_stats AS older '
+        'USING match_stats AS newer '
+        'WHERE older.match_id = newer.match_id '
+        'AND older.team_id = newer.team_id '
+        'AND older.id < newer.id'
+    )
+    # The unique constraint's index replaces the plain composite index
+    op.create_unique_constraint('uq_match_stat_match_team', 'match_stats', ['match_id', 'team_id'])
+    op.drop_index('idx_match_stat_match_team', table_name='match_stats')
+
+
+def downgrade() -> None:
+    op.create_index('idx_match_stat_match_team', 'match_stats', ['match_id', 'team_id'], unique=False)
+    op.drop_constraint('uq_match_stat_match_team', 'match_stats', type_='unique')
@@ -0,0 +1,119 @@
+"""Move per-sport match statistics into a JSONB column
+
+Revision ID: 006_match_stats_jsonb
+Revises: 005_match_stats_unique
+Create Date: 2024-02-12 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006_match_stats_jsonb'
+down_revision: Union[str, None] = '005_match_stats_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, type, nullable) of the statistic columns folded into match_stats.stats
+STAT_COLUMNS = (
+    ('possession_percent', sa.Numeric(precision=5, scale=2), True),
+    ('total_shots', sa.Integer(), False),
+    ('shots_on_target', sa.Integer(), False),
+    ('shots_off_target', sa.Integer(), False),
+    ('corners', sa.Integer(), False),
+    ('fouls', sa.Integer(), False),
+    ('yellow_cards', sa.Integer(), False),
+    ('red_cards', sa.Integer(), False),
+    ('offsides', sa.Integer(), False),
+    ('passes_total', sa.Integer(), False),
+    ('passes_accurate', sa.Integer(), False),
+    ('pass_accuracy', sa.Numeric(precision=5, scale=2), True),
+    ('crosses_total', sa.Integer(), False),
+    ('crosses_accurate', sa.Integer(), False),
+    ('field_goals_made', sa.Integer(), False),
+    ('field_goals_attempted', sa.Integer(), False),
+    ('three_pointers_made', sa.Integer(), False),
+    ('three_pointers_attempted', sa.Integer(), False),
+    ('free_throws_made', sa.Integer(), False),
+    ('free_throws_attempted', sa.Integer(), False),
+    ('rebounds_offensive', sa.Integer(), False),
+    ('rebounds_defensive', sa.Integer(), False),
+    ('rebounds_total', sa.Integer(), False),
+    ('assists', sa.Integer(), False),
+    ('steals', sa.Integer(), False),
+    ('blocks', sa.Integer(), False),
+    ('turnovers', sa.Integer(), False),
+    ('personal_fouls', sa.Integer(), False),
+    ('first_downs', sa.Integer(), False),
+    ('rushing_yards', sa.Integer(), False),
+    ('passing_yards', sa.Integer(), False),
+    ('total_yards', sa.Integer(), False),
+    ('penalties', sa.Integer(), False),
+    ('penalty_yards', sa.Integer(), False),
+    ('time_of_possession', sa.String(length=10), True),
+    ('hits', sa.Integer(), False),
+    ('runs', sa.Integer(), False),
+    ('errors', sa.Integer(), False),
+    ('strikeouts', sa.Integer(), False),
+    ('walks', sa.Integer(), False),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'match_stats',
+        sa.Column('stats', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+    )
+
+    # Copy the statistics, dropping NULLs and zero counters (the defaults
+    # readers fall back to); zeros of nullable columns are real values
+    pairs = ', '.join(f"'{name}', {name}" for name, _, _ in STAT_COLUMNS)
+    nullable = ', '.join(f"'{name}'" for name, _, is_nullable in STAT_COLUMNS if is_nullable)
+    op.execute(
+        f"""
+        UPDATE match_stats SET stats = COALESCE(
+            (SELECT jsonb_object_agg(key, value)
+             FROM jsonb_each(jsonb_strip_nulls(jsonb_build_object({pairs})))
+             WHERE value <> '0'::jsonb OR key IN ({nullable})),
+            '{{}}'::jsonb
+        )
+        """
+    )
+
+    op.create_index(
+        'idx_match_stat_stats_gin',
+        'match_stats',
+        ['stats'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'stats': 'jsonb_path_ops'},
+    )
+
+    for name, _, _ in STAT_COLUMNS:
+        op.drop_column('match_stats', name)
+
+
+def downgrade() -> None:
+    for name, type_, nullable in STAT_COLUMNS:
+        op.add_column(
+            'match_stats',
+            sa.Column(name, type_, nullable=nullable, server_default=None if nullable else '0'),
+        )
+
+    assignments = ', '.join(
+        f"{name} = (stats->>'{name}')::{type_.compile(dialect=postgresql.dialect())}"
+        if nullable else
+        f"{name} = COALESCE((stats->>'{name}')::{type_.compile(dialect=postgresql.dialect())}, 0)"
+        for name, type_, nullable in STAT_COLUMNS
+    )
+    op.execute(f"UPDATE match_stats SET {assignments}")
+
+    for name, _, nullable in STAT_COLUMNS:
+        if not nullable:
+            op.alter_column('match_stats', name, server_default=None)
+
+    op.drop_index('idx_match_stat_stats_gin', table_name='match_stats')
+    op.drop_column('match_stats', 'stats')
@@ -0,0 +1,62 @@
+"""Store historical result counters as SMALLINT
+
+Revision ID: 007_historical_smallint
+Revises: 006_match_stats_jsonb
+Create Date: 2024-02-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_historical_smallint'
+down_revision: Union[str, None] = '006_match_stats_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Per-season counters; even basketball point totals stay far below 32767
+COUNTER_COLUMNS = (
+    'matches_played',
+    'matches_won',
+    'matches_drawn',
+    'matches_lost',
+    'goals_for',
+    'goals_against',
+    'goal_difference',
+    'points',
+    'home_matches_played',
+    'home_matches_won',
+    'home_matches_drawn',
+    'home_matches_lost',
+    'home_goals_for',
+    'home_goals_against',
+    'away_matches_played',
+    'away_matches_won',
+    'away_matches_drawn',
+    'away_matches_lost',
+    'away_goals_for',
+    'away_goals_against',
+    'current_win_streak',
+    'current_loss_streak',
+    'current_unbeaten_streak',
+)
+
+
+def upgrade() -> None:
+    # One ALTER TABLE so historical_results is rewritten once, not per column
+    op.execute(
+        'ALTER TABLE historical_results '
+        + ', '.join(
+            f'ALTER COLUMN {name} TYPE smallint USING {name}::smallint'
+            for name in COUNTER_COLUMNS
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE historical_results '
+        + ', '.join(f'ALTER COLUMN {name} TYPE integer' for name in COUNTER_COLUMNS)
+    )
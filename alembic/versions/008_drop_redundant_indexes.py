@@ -0,0 +1,32 @@
+"""Drop indexes already covered by a composite index's leading columns
+
+Revision ID: 008_drop_redundant_indexes
+Revises: 007_historical_smallint
+Create Date: 2024-02-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008_drop_redundant_indexes'
+down_revision: Union[str, None] = '007_historical_smallint'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # team_id lookups use ix_match_stats_team_id
+    op.drop_index('idx_match_stat_team_match', table_name='match_stats')
+    # Covered by idx_team_league_active / idx_team_league_name
+    op.drop_index('ix_teams_league_id', table_name='teams')
+    # Covered by idx_team_conference_division
+    op.drop_index('ix_teams_conference', table_name='teams')
+
+
+def downgrade() -> None:
+    op.create_index('ix_teams_conference', 'teams', ['conference'], unique=False)
+    op.create_index('ix_teams_league_id', 'teams', ['league_id'], unique=False)
+    op.create_index('idx_match_stat_team_match', 'match_stats', ['team_id', 'match_id'], unique=False)
@@ -0,0 +1,31 @@
+"""Add a BRIN index on match_stats.created_at for recent-row scans
+
+Revision ID: 009_match_stats_created_brin
+Revises: 008_drop_redundant_indexes
+Create Date: 2024-02-22 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009_match_stats_created_brin'
+down_revision: Union[str, None] = '008_drop_redundant_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_match_stat_created_brin',
+        'match_stats',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_match_stat_created_brin', table_name='match_stats')
@@ -0,0 +1,30 @@
+"""Cascade player deletes from teams in the database
+
+Revision ID: 010_players_team_cascade
+Revises: 009_match_stats_created_brin
+Create Date: 2024-02-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_players_team_cascade'
+down_revision: Union[str, None] = '009_match_stats_created_brin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The ORM no longer loads and deletes a team's players itself
+    op.drop_constraint('players_team_id_fkey', 'players', type_='foreignkey')
+    op.create_foreign_key(
+        'players_team_id_fkey', 'players', 'teams', ['team_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('players_team_id_fkey', 'players', type_='foreignkey')
+    op.create_foreign_key('players_team_id_fkey', 'players', 'teams', ['team_id'], ['id'])
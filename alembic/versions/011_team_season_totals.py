@@ -0,0 +1,102 @@
+"""Keep per-team statistic totals on teams, maintained by a match_stats trigger
+
+Revision ID: 011_team_season_totals
+Revises: 010_players_team_cascade
+Create Date: 2024-02-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '011_team_season_totals'
+down_revision: Union[str, None] = '010_players_team_cascade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Percentages don't add up across matches, so they are left out of the totals
+NON_ADDITIVE_STATS = ('possession_percent', 'pass_accuracy')
+
+
+def upgrade() -> None:
+    op.add_column(
+        'teams',
+        sa.Column('season_totals', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+    )
+
+    excluded = ', '.join(f"'{name}'" for name in NON_ADDITIVE_STATS)
+
+    # totals + sign * stats for every numeric statistic, plus a match count
+    op.execute(
+        f"""
+        CREATE FUNCTION team_season_totals_apply(totals jsonb, stats jsonb, sign integer)
+        RETURNS jsonb LANGUAGE sql IMMUTABLE AS $$
+            SELECT totals
+                || jsonb_build_object('matches', COALESCE((totals->>'matches')::numeric, 0) + sign)
+                || COALESCE(
+                    (SELECT jsonb_object_agg(
+                                key,
+                                COALESCE((totals->>key)::numeric, 0) + sign * (value #>> '{{}}')::numeric
+                            )
+                     FROM jsonb_each(stats)
+                     WHERE jsonb_typeof(value) = 'number' AND key NOT IN ({excluded})),
+                    '{{}}'::jsonb
+                )
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION match_stats_season_totals() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE teams SET season_totals = team_season_totals_apply(season_totals, OLD.stats, -1)
+                WHERE id = OLD.team_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE teams SET season_totals = team_season_totals_apply(season_totals, NEW.stats, 1)
+                WHERE id = NEW.team_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_match_stats_season_totals
+        AFTER INSERT OR DELETE OR UPDATE OF stats, team_id ON match_stats
+        FOR EACH ROW EXECUTE FUNCTION match_stats_season_totals()
+        """
+    )
+
+    # Backfill from the rows already stored
+    op.execute(
+        f"""
+        WITH sums AS (
+            SELECT ms.team_id, e.key, sum((e.value #>> '{{}}')::numeric) AS total
+            FROM match_stats ms, jsonb_each(ms.stats) e
+            WHERE jsonb_typeof(e.value) = 'number' AND e.key NOT IN ({excluded})
+            GROUP BY ms.team_id, e.key
+        ), counts AS (
+            SELECT team_id, count(*) AS matches FROM match_stats GROUP BY team_id
+        )
+        UPDATE teams SET season_totals = jsonb_build_object('matches', counts.matches)
+            || COALESCE(
+                (SELECT jsonb_object_agg(sums.key, sums.total) FROM sums WHERE sums.team_id = counts.team_id),
+                '{{}}'::jsonb
+            )
+        FROM counts
+        WHERE counts.team_id = teams.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER trg_match_stats_season_totals ON match_stats')
+    op.execute('DROP FUNCTION match_stats_season_totals()')
+    op.execute('DROP FUNCTION team_season_totals_apply(jsonb, jsonb, integer)')
+    op.drop_column('teams', 'season_totals')
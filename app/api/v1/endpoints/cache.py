@@ -27,6 +27,8 @@ async def get_cache_stats(
         
         stats = {
             "redis_available": redis_available,
+            "fallback_active": cache_manager.fallback_active,
+            "memory_entries": cache_manager.memory_usage(),
             "cache_types": {
                 "live_matches": CacheType.LIVE_MATCHES.value,
                 "historical_data": CacheType.HISTORICAL_DATA.value,
@@ -12,7 +12,7 @@ from app.application.dto.probability_config_dto import (
     ProbabilityConfigCreateDTO,
     ProbabilityConfigUpdateDTO,
 )
-from app.infrastructure.config.probability_config_service import config_service
+from app.infrastructure.config.probability_config_service import get_config_service
 
 router = APIRouter()
 
@@ -27,7 +27,7 @@ async def get_all_configs(
     verify_admin_token(authorization)
     
     try:
-        configs = config_service.get_all_configs()
+        configs = get_config_service().get_all_configs()
         return configs
     except Exception as e:
         raise HTTPException(
@@ -44,7 +44,7 @@ async def get_active_config(
     verify_admin_token(authorization)
     
     try:
-        config = config_service.get_config()
+        config = get_config_service().get_config()
         if not config:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -71,7 +71,7 @@ async def get_config_by_version(
     verify_admin_token(authorization)
     
     try:
-        config = config_service.get_config(version=version)
+        config = get_config_service().get_config(version=version)
         if not config:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -111,14 +111,14 @@ async def create_config(
             is_active=config_data.is_active,
         )
         
-        errors = config_service.validate_config(full_config)
+        errors = get_config_service().validate_config(full_config)
         if errors:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail={"validation_errors": errors},
             )
         
-        config = config_service.create_config(config_data)
+        config = get_config_service().create_config(config_data)
         return config
     except ValueError as e:
         raise HTTPException(
@@ -147,7 +147,7 @@ async def update_config(
     
     try:
         # Get current config
-        current_config = config_service.get_config(version=version)
+        current_config = get_config_service().get_config(version=version)
         if not current_config:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -167,14 +167,14 @@ async def update_config(
         )
         
         # Validate
-        errors = config_service.validate_config(updated_config)
+        errors = get_config_service().validate_config(updated_config)
         if errors:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail={"validation_errors": errors},
             )
         
-        config = config_service.update_config(version, config_data)
+        config = get_config_service().update_config(version, config_data)
         return config
     except ValueError as e:
         raise HTTPException(
@@ -201,7 +201,7 @@ async def delete_config(
     verify_admin_token(authorization)
     
     try:
-        deleted = config_service.delete_config(version)
+        deleted = get_config_service().delete_config(version)
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -233,7 +233,7 @@ async def activate_config(
     verify_admin_token(authorization)
     
     try:
-        config = config_service.activate_config(version)
+        config = get_config_service().activate_config(version)
         return config
     except ValueError as e:
         raise HTTPException(
@@ -269,7 +269,7 @@ async def validate_config(
             is_active=config_data.is_active,
         )
         
-        errors = config_service.validate_config(full_config)
+        errors = get_config_service().validate_config(full_config)
         
         return {
             "valid": len(errors) == 0,
@@ -9,8 +9,9 @@ from app.core.dependencies import get_db, get_match_repository, get_team_reposit
 from app.core.config import settings
 from app.core.rate_limit import limiter
 from app.application.dto.match_dto import MatchResponseDTO
-from app.infrastructure.external.gemini_client import GeminiClient
+from app.infrastructure.external.gemini_client import get_gemini_client
 from fastapi import Request
+from fastapi.responses import StreamingResponse
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ async def analyze_match(
         POST /api/v1/sofascore/analyze-match?home_team=Arsenal&away_team=Chelsea&league=Premier League
     """
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
         analysis = await client.analyze_match(
             home_team=home_team,
             away_team=away_team,
@@ -65,6 +66,48 @@ async def analyze_match(
         )
 
 
+@router.post("/analyze-match/stream", status_code=200)
+@limiter.limit(f"{settings.RATE_LIMIT_PER_MINUTE}/minute")
+async def analyze_match_stream(
+    request: Request,
+    home_team: str = Query(..., description="Home team name"),
+    away_team: str = Query(..., description="Away team name"),
+    sport: str = Query("football", description="Sport type (football, basketball, etc.)"),
+    league: Optional[str] = Query(None, description="League name (optional)"),
+    match_date: Optional[str] = Query(None, description="Match date (optional)"),
+):
+    """Stream a Gemini match analysis as server-sent events.
+    
+    Same analysis as /analyze-match, but the generated text is sent as
+    "chunk" events while Gemini produces it, so clients can show progress
+    immediately. The parsed analysis arrives last as an "analysis" event,
+    or an "error" event if generation fails part-way.
+    
+    Example:
+        POST /api/v1/sofascore/analyze-match/stream?home_team=Arsenal&away_team=Chelsea
+    """
+    try:
+        client = get_gemini_client()
+    except Exception as e:
+        logger.error(f"Error initializing Gemini client: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate analysis: {str(e)}"
+        )
+
+    return StreamingResponse(
+        client.analyze_match_stream(
+            home_team=home_team,
+            away_team=away_team,
+            sport=sport,
+            league=league,
+            match_date=match_date
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/team-statistics", status_code=200)
 @limiter.limit(f"{settings.RATE_LIMIT_PER_MINUTE}/minute")
 async def get_team_statistics(
@@ -89,7 +132,7 @@ async def get_team_statistics(
         GET /api/v1/sofascore/team-statistics?team_name=Manchester United&league=Premier League
     """
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
         stats = await client.get_team_statistics(
             team_name=team_name,
             sport=sport,
@@ -131,7 +174,7 @@ async def analyze_match_with_context(
         Body: {{"home_team": "Arsenal", "away_team": "Chelsea", "league": "Premier League"}}
     """
     try:
-        client = GeminiClient()
+        client = get_gemini_client()
         analysis = await client.analyze_match_with_context(match_data=match_data)
         
         logger.info(f"Successfully generated contextual analysis")
@@ -150,21 +150,10 @@ class MatchService:
             # If team lookup fails, continue without team names
             logger.debug(f"Could not fetch team names for match {match.id}: {e}")
         
-        return MatchResponseDTO(
-            id=match.id,
-            home_team_id=match.home_team_id,
-            away_team_id=match.away_team_id,
-            home_team_name=home_team_name,
-            away_team_name=away_team_name,
-            sport=match.sport,
-            league=match.league,
-            match_date=match.match_date,
-            status=match.status,
-            home_score=match.home_score,
-            away_score=match.away_score,
-            venue=match.venue,
-            attendance=match.attendance,
-            created_at=match.created_at,
-            updated_at=match.updated_at,
-        )
+        # Names go into the validated input so their max_length is enforced
+        return MatchResponseDTO.model_validate({
+            **vars(match),
+            "home_team_name": home_team_name,
+            "away_team_name": away_team_name,
+        })
 
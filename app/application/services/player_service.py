@@ -105,17 +105,4 @@ class PlayerService:
 
     def _entity_to_dto(self, player: Player) -> PlayerResponseDTO:
         """Convert entity to DTO."""
-        return PlayerResponseDTO(
-            id=player.id,
-            name=player.name,
-            position=player.position,
-            team_id=player.team_id,
-            jersey_number=player.jersey_number,
-            height=player.height,
-            weight=player.weight,
-            date_of_birth=player.date_of_birth,
-            nationality=player.nationality,
-            created_at=player.created_at,
-            updated_at=player.updated_at,
-        )
-
+        return PlayerResponseDTO.model_validate(player, from_attributes=True)
@@ -105,17 +105,4 @@ class TeamService:
 
     def _entity_to_dto(self, team: Team) -> TeamResponseDTO:
         """Convert entity to DTO."""
-        return TeamResponseDTO(
-            id=team.id,
-            name=team.name,
-            code=team.code,
-            sport=team.sport,
-            league=team.league,
-            country=team.country,
-            city=team.city,
-            founded_year=team.founded_year,
-            logo_url=team.logo_url,
-            created_at=team.created_at,
-            updated_at=team.updated_at,
-        )
-
+        return TeamResponseDTO.model_validate(team, from_attributes=True)
@@ -73,6 +73,9 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = Field(default="", description="Google Gemini API key for sports analysis (set via GEMINI_API_KEY env var)")
     GEMINI_MODEL: str = Field(default="gemini-3-flash-preview", description="Gemini model name (gemini-3-flash-preview, gemini-1.5-flash, gemini-1.5-pro)")
     GEMINI_CACHE_TTL: int = Field(default=3600, description="Gemini analysis cache TTL in seconds (default: 1 hour)")
+    GEMINI_MAX_CONCURRENCY: int = Field(default=4, ge=1, description="Maximum concurrent Gemini requests per process")
+    GEMINI_REQUESTS_PER_SECOND: float = Field(default=2.0, gt=0, description="Maximum Gemini request starts per second per process")
+    SOFASCORE_REQUESTS_PER_SECOND: float = Field(default=5.0, gt=0, description="Maximum SofaScore request starts per second per process")
 
     # Proxy/Cache Settings
     CACHE_ENABLED: bool = Field(default=True)
@@ -252,7 +252,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         now = datetime.utcnow()
 
         # Try Redis first
-        redis_client_instance = await redis_client.get_client()
+        redis_client_instance = redis_client.instance
         if redis_client_instance:
             try:
                 # Check per-minute limit
@@ -1,14 +1,23 @@
 """Advanced cache manager with TTL control and multiple cache types."""
 
-import json
+import asyncio
 import hashlib
 import logging
-from typing import Optional, Any, Dict, Callable, Union
-from datetime import datetime, timedelta
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Optional, Any, Awaitable, Dict, Callable, List, Tuple, Union
 from functools import wraps
 from enum import Enum
 
+import msgspec
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.exceptions import LockError
+
 from app.infrastructure.cache.redis_client import redis_client
+from app.infrastructure.cache.serialization import enc_hook
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -33,9 +42,123 @@ class CacheManager:
         CacheType.GENERAL: 300,  # 5 minutes default
     }
 
+    # Maximum in-memory entries per cache type (LRU eviction beyond this)
+    MEMORY_CACHE_SIZE = {
+        CacheType.LIVE_MATCHES: 2048,
+        CacheType.HISTORICAL_DATA: 512,
+        CacheType.API_RESPONSE: 4096,
+        CacheType.GENERAL: 1024,
+    }
+
+    # Seconds between Redis pings while the memory fallback is active
+    HEALTH_CHECK_INTERVAL = 5
+
+    # Pattern deletes: keys per DEL/UNLINK call, and the size above which
+    # UNLINK's background reclamation beats DEL's lower per-call overhead
+    DELETE_BATCH_SIZE = 500
+    UNLINK_THRESHOLD = 8
+
+    # SCAN TYPE filter per cache type; live matches mix strings and hashes
+    SCAN_TYPE = {
+        CacheType.LIVE_MATCHES: None,
+        CacheType.HISTORICAL_DATA: "string",
+        CacheType.API_RESPONSE: "string",
+        CacheType.GENERAL: "string",
+    }
+
+    # SCAN COUNT hint per cache type, sized to the expected keyspace
+    SCAN_COUNT = {
+        CacheType.LIVE_MATCHES: 2000,
+        CacheType.HISTORICAL_DATA: 10000,
+        CacheType.API_RESPONSE: 5000,
+        CacheType.GENERAL: 5000,
+    }
+
     def __init__(self):
         """Initialize cache manager."""
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        # One LRU bucket per cache type: key -> (expires_at, payload)
+        self.memory_cache: Dict[CacheType, "OrderedDict[str, Tuple[float, Any]]"] = {
+            cache_type: OrderedDict() for cache_type in CacheType
+        }
+        self._redis_ok: bool = True
+        self._health_task: Optional[asyncio.Task] = None
+        # MessagePack is smaller than JSON and Redis stores the bytes as-is.
+        # Reused across calls: the encoder keeps its internal write buffer
+        self._encoder = msgspec.msgpack.Encoder(enc_hook=enc_hook)
+        self._decoder = msgspec.msgpack.Decoder()
+        # Fallback stampede locks, dropped once no caller holds them
+        self._local_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    @property
+    def fallback_active(self) -> bool:
+        """Whether operations are currently served by the memory tier."""
+        return not self._redis_ok
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Number of entries held in each memory bucket."""
+        return {cache_type.value: len(bucket) for cache_type, bucket in self.memory_cache.items()}
+
+    def enable_fallback(self):
+        """Route calls to the memory tier until the health check sees Redis again."""
+        self._redis_ok = False
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._monitor_redis())
+
+    async def close(self):
+        """Stop the background health check."""
+        if self._health_task is not None and not self._health_task.done():
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+        self._health_task = None
+
+    async def _monitor_redis(self):
+        """Ping Redis periodically and restore routing once it responds."""
+        while True:
+            await asyncio.sleep(self.HEALTH_CHECK_INTERVAL)
+            if await redis_client.health_check():
+                self._redis_ok = True
+                logger.info("Redis available again, leaving memory cache fallback")
+                return
+
+    async def _execute(
+        self,
+        operation: str,
+        redis_fn: Callable[[Any], Awaitable[Any]],
+        memory_fn: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Run an operation against Redis, falling back to the memory tier.
+
+        While Redis is marked unhealthy the Redis branch is skipped entirely,
+        so an outage costs one failed call rather than one timeout per request.
+        Command errors (e.g. a wrong key type) fall back without tripping it.
+
+        Args:
+            operation: Operation name used in error logs
+            redis_fn: Coroutine function receiving the Redis client
+            memory_fn: Optional fallback used when Redis is unavailable
+
+        Returns:
+            Result of whichever tier handled the operation
+        """
+        if self._redis_ok:
+            client = redis_client.instance
+            if client is None:
+                self.enable_fallback()
+            else:
+                try:
+                    return await redis_fn(client)
+                except (RedisConnectionError, RedisTimeoutError) as e:
+                    logger.error(f"Redis {operation} error: {e}")
+                    self.enable_fallback()
+                except Exception as e:
+                    logger.error(f"Redis {operation} error: {e}")
+
+        return memory_fn() if memory_fn is not None else None
 
     def _generate_key(
         self,
@@ -50,6 +173,58 @@ class CacheManager:
         parts.append(key)
         return ":".join(parts)
 
+    def _encode(self, value: Any) -> bytes:
+        """Encode a value into the canonical payload stored in every tier."""
+        return self._encoder.encode(value)
+
+    def _decode(self, payload: Any) -> Any:
+        """Decode a payload produced by ``_encode``.
+
+        Payloads that can't be decoded (e.g. written in an older format) are
+        treated as a cache miss.
+        """
+        try:
+            return self._decoder.decode(payload)
+        except msgspec.DecodeError:
+            logger.debug("Discarding undecodable cache payload")
+            return None
+
+    def _memory_get(self, cache_type: CacheType, cache_key: str) -> Optional[Any]:
+        """Return the raw payload from the memory tier, or None if absent/expired."""
+        bucket = self.memory_cache[cache_type]
+        cached_item = bucket.get(cache_key)
+        if cached_item is not None:
+            expires_at, payload = cached_item
+            if time.monotonic() < expires_at:
+                bucket.move_to_end(cache_key)
+                return payload
+            del bucket[cache_key]
+        return None
+
+    def _memory_get_string(self, cache_type: CacheType, cache_key: str) -> Optional[bytes]:
+        """Return a plain value payload from the memory tier.
+
+        Hash buckets and event streams live in the same tier; like Redis GET on
+        a key of another type, reading one as a plain value is a miss.
+        """
+        payload = self._memory_get(cache_type, cache_key)
+        return payload if isinstance(payload, bytes) else None
+
+    def _memory_set(
+        self,
+        cache_type: CacheType,
+        cache_key: str,
+        payload: Any,
+        ttl: int,
+    ):
+        """Store a payload in the memory tier, evicting LRU entries over capacity."""
+        bucket = self.memory_cache[cache_type]
+        bucket[cache_key] = (time.monotonic() + ttl, payload)
+        bucket.move_to_end(cache_key)
+        max_size = self.MEMORY_CACHE_SIZE[cache_type]
+        while len(bucket) > max_size:
+            bucket.popitem(last=False)
+
     async def get(
         self,
         cache_type: CacheType,
@@ -68,25 +243,12 @@ class CacheManager:
         """
         cache_key = self._generate_key(cache_type, key, prefix)
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                cached_data = await client.get(cache_key)
-                if cached_data:
-                    return json.loads(cached_data)
-            except Exception as e:
-                logger.error(f"Redis get error: {e}")
-
-        # Fallback to memory cache
-        if cache_key in self.memory_cache:
-            cached_item = self.memory_cache[cache_key]
-            if datetime.utcnow() < cached_item["expires_at"]:
-                return cached_item["data"]
-            else:
-                del self.memory_cache[cache_key]
-
-        return None
+        payload = await self._execute(
+            "get",
+            lambda client: client.get(cache_key),
+            lambda: self._memory_get_string(cache_type, cache_key),
+        )
+        return self._decode(payload) if payload else None
 
     async def set(
         self,
@@ -110,31 +272,391 @@ class CacheManager:
         if ttl is None:
             ttl = self.DEFAULT_TTL.get(cache_type, self.DEFAULT_TTL[CacheType.GENERAL])
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                cache_data = json.dumps(value, default=str)
-                await client.setex(cache_key, ttl, cache_data)
-                return
-            except Exception as e:
-                logger.error(f"Redis set error: {e}")
+        # Encode once; both tiers store the same canonical payload
+        payload = self._encode(value)
+
+        await self._execute(
+            "set",
+            lambda client: client.set(cache_key, payload, ex=ttl),
+            lambda: self._memory_set(cache_type, cache_key, payload, ttl),
+        )
 
-        # Fallback to memory cache
-        self.memory_cache[cache_key] = {
-            "data": value,
-            "expires_at": datetime.utcnow() + timedelta(seconds=ttl),
+    async def get_many(
+        self,
+        cache_type: CacheType,
+        keys: List[str],
+        prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get several cached values in a single round trip.
+
+        Args:
+            cache_type: Type of cache
+            keys: Cache keys
+            prefix: Optional key prefix
+
+        Returns:
+            Mapping of key to cached value for the keys that were found
+        """
+        if not keys:
+            return {}
+
+        cache_keys = [self._generate_key(cache_type, key, prefix) for key in keys]
+
+        payloads = await self._execute(
+            "mget",
+            lambda client: client.mget(cache_keys),
+            lambda: [self._memory_get_string(cache_type, k) for k in cache_keys],
+        )
+
+        return {
+            key: self._decode(payload)
+            for key, payload in zip(keys, payloads)
+            if payload
         }
 
-        # Clean up old entries
-        if len(self.memory_cache) > 1000:
-            now = datetime.utcnow()
-            expired_keys = [
-                k for k, v in self.memory_cache.items()
-                if v["expires_at"] < now
-            ]
-            for key_to_delete in expired_keys:
-                del self.memory_cache[key_to_delete]
+    async def set_many(
+        self,
+        cache_type: CacheType,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Set several cached values in a single pipelined round trip.
+
+        Args:
+            cache_type: Type of cache
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (uses default if None)
+            prefix: Optional key prefix
+        """
+        if not items:
+            return
+
+        if ttl is None:
+            ttl = self.DEFAULT_TTL.get(cache_type, self.DEFAULT_TTL[CacheType.GENERAL])
+
+        payloads = {
+            self._generate_key(cache_type, key, prefix): self._encode(value)
+            for key, value in items.items()
+        }
+
+        async def redis_set_many(client):
+            async with client.pipeline(transaction=False) as pipe:
+                for cache_key, payload in payloads.items():
+                    pipe.set(cache_key, payload, ex=ttl)
+                await pipe.execute()
+
+        def memory_set_many():
+            for cache_key, payload in payloads.items():
+                self._memory_set(cache_type, cache_key, payload, ttl)
+
+        await self._execute("mset", redis_set_many, memory_set_many)
+
+    async def hset_many(
+        self,
+        cache_type: CacheType,
+        key: str,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Store a hash of individually encoded fields, replacing any existing one.
+
+        Args:
+            cache_type: Type of cache
+            key: Cache key
+            mapping: Field name to value
+            ttl: Time to live in seconds (uses default if None)
+            prefix: Optional key prefix
+        """
+        await self.hset_batch(cache_type, {key: mapping}, ttl=ttl, prefix=prefix)
+
+    async def hset_batch(
+        self,
+        cache_type: CacheType,
+        hashes: Dict[str, Dict[str, Any]],
+        ttl: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Replace several hashes in a single MULTI/EXEC round trip.
+
+        Args:
+            cache_type: Type of cache
+            hashes: Mapping of cache key to its field name/value mapping
+            ttl: Time to live in seconds (uses default if None)
+            prefix: Optional key prefix
+        """
+        if not hashes:
+            return
+
+        if ttl is None:
+            ttl = self.DEFAULT_TTL.get(cache_type, self.DEFAULT_TTL[CacheType.GENERAL])
+
+        payloads = {
+            self._generate_key(cache_type, key, prefix): {
+                field: self._encode(value) for field, value in mapping.items()
+            }
+            for key, mapping in hashes.items()
+        }
+
+        async def redis_hset_batch(client):
+            async with client.pipeline(transaction=True) as pipe:
+                for cache_key, fields in payloads.items():
+                    pipe.delete(cache_key)
+                    if fields:
+                        pipe.hset(cache_key, mapping=fields)
+                        pipe.expire(cache_key, ttl)
+                await pipe.execute()
+
+        def memory_hset_batch():
+            for cache_key, fields in payloads.items():
+                self._memory_set(cache_type, cache_key, fields, ttl)
+
+        await self._execute("hset", redis_hset_batch, memory_hset_batch)
+
+    async def hgetall(
+        self,
+        cache_type: CacheType,
+        key: str,
+        prefix: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get every field of a cached hash.
+
+        Args:
+            cache_type: Type of cache
+            key: Cache key
+            prefix: Optional key prefix
+
+        Returns:
+            Field name to decoded value, or None if the hash isn't cached
+        """
+        cache_key = self._generate_key(cache_type, key, prefix)
+
+        payloads = await self._execute(
+            "hgetall",
+            lambda client: client.hgetall(cache_key),
+            lambda: self._memory_get(cache_type, cache_key),
+        )
+        if not payloads:
+            return None
+
+        return {
+            field.decode() if isinstance(field, bytes) else field: self._decode(payload)
+            for field, payload in payloads.items()
+        }
+
+    async def get_counter(
+        self,
+        cache_type: CacheType,
+        key: str,
+        prefix: Optional[str] = None,
+    ) -> Optional[int]:
+        """Read an integer counter maintained with ``incr``.
+
+        Counters live only in Redis; None is returned when it is unavailable.
+
+        Args:
+            cache_type: Type of cache
+            key: Counter key
+            prefix: Optional key prefix
+
+        Returns:
+            Counter value (0 if never incremented) or None
+        """
+        cache_key = self._generate_key(cache_type, key, prefix)
+
+        async def redis_get_counter(client):
+            value = await client.get(cache_key)
+            return int(value) if value else 0
+
+        return await self._execute("get counter", redis_get_counter)
+
+    async def incr(
+        self,
+        cache_type: CacheType,
+        key: str,
+        prefix: Optional[str] = None,
+    ) -> Optional[int]:
+        """Atomically increment an integer counter.
+
+        Args:
+            cache_type: Type of cache
+            key: Counter key
+            prefix: Optional key prefix
+
+        Returns:
+            New counter value or None if Redis is unavailable
+        """
+        cache_key = self._generate_key(cache_type, key, prefix)
+        return await self._execute("incr", lambda client: client.incr(cache_key))
+
+    async def xadd(
+        self,
+        cache_type: CacheType,
+        key: str,
+        value: Any,
+        maxlen: int,
+        ttl: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ):
+        """Append an event to a capped stream.
+
+        Args:
+            cache_type: Type of cache
+            key: Stream key
+            value: Event to append
+            maxlen: Approximate number of most recent events to keep
+            ttl: Time to live in seconds, refreshed on every append (uses default if None)
+            prefix: Optional key prefix
+        """
+        cache_key = self._generate_key(cache_type, key, prefix)
+
+        if ttl is None:
+            ttl = self.DEFAULT_TTL.get(cache_type, self.DEFAULT_TTL[CacheType.GENERAL])
+
+        payload = self._encode(value)
+
+        async def redis_xadd(client):
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.xadd(cache_key, {"v": payload}, maxlen=maxlen, approximate=True)
+                pipe.expire(cache_key, ttl)
+                await pipe.execute()
+
+        def memory_xadd():
+            events = self._memory_get(cache_type, cache_key)
+            if events is None:
+                events = deque(maxlen=maxlen)
+            events.append(payload)
+            self._memory_set(cache_type, cache_key, events, ttl)
+
+        await self._execute("xadd", redis_xadd, memory_xadd)
+
+    async def xrevrange_many(
+        self,
+        cache_type: CacheType,
+        keys: List[str],
+        count: int = 1,
+        prefix: Optional[str] = None,
+    ) -> Dict[str, List[Any]]:
+        """Read the latest events of several streams in one pipelined round trip.
+
+        Args:
+            cache_type: Type of cache
+            keys: Stream keys
+            count: Number of most recent events to return per stream
+            prefix: Optional key prefix
+
+        Returns:
+            Mapping of key to its events, newest first; empty streams are omitted
+        """
+        if not keys:
+            return {}
+
+        cache_keys = [self._generate_key(cache_type, key, prefix) for key in keys]
+
+        async def redis_xrevrange_many(client):
+            async with client.pipeline(transaction=False) as pipe:
+                for cache_key in cache_keys:
+                    pipe.xrevrange(cache_key, count=count)
+                results = await pipe.execute()
+            return [[fields[b"v"] for _, fields in entries] for entries in results]
+
+        def memory_xrevrange_many():
+            results = []
+            for cache_key in cache_keys:
+                events = self._memory_get(cache_type, cache_key) or ()
+                results.append(list(reversed(events))[:count])
+            return results
+
+        results = await self._execute("xrevrange", redis_xrevrange_many, memory_xrevrange_many)
+
+        return {
+            key: [self._decode(payload) for payload in payloads]
+            for key, payloads in zip(keys, results)
+            if payloads
+        }
+
+    @asynccontextmanager
+    async def lock(
+        self,
+        cache_type: CacheType,
+        key: str,
+        timeout: float = 5,
+        blocking_timeout: float = 2,
+        prefix: Optional[str] = None,
+    ):
+        """Hold a short lock on a key so only one caller recomputes it.
+
+        Uses a Redis lock shared by every worker, or a process-local lock
+        while Redis is unavailable. If the lock can't be acquired within
+        ``blocking_timeout`` the block runs anyway, so callers should re-check
+        the cache inside it rather than rely on exclusivity.
+
+        Args:
+            cache_type: Type of cache
+            key: Cache key being recomputed
+            timeout: Seconds after which a held Redis lock expires
+            blocking_timeout: Seconds to wait for the lock
+            prefix: Optional key prefix
+        """
+        lock_key = self._generate_key(cache_type, f"{key}:lock", prefix)
+        client = redis_client.instance if self._redis_ok else None
+
+        if client is None:
+            local_lock = self._local_locks.get(lock_key)
+            if local_lock is None:
+                local_lock = self._local_locks[lock_key] = asyncio.Lock()
+            async with local_lock:
+                yield
+            return
+
+        redis_lock = client.lock(lock_key, timeout=timeout, blocking_timeout=blocking_timeout)
+        acquired = False
+        try:
+            acquired = await redis_lock.acquire()
+        except (RedisConnectionError, RedisTimeoutError):
+            self.enable_fallback()
+        except Exception as e:
+            logger.error(f"Redis lock error: {e}")
+
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    await redis_lock.release()
+                except LockError:
+                    # Expired while held; another caller may own it now
+                    pass
+
+    @classmethod
+    async def _delete_matching(cls, client, cache_type: CacheType, pattern: str):
+        """Delete every Redis key matching a SCAN pattern.
+
+        Keys are removed in batches as the scan progresses; larger batches use
+        UNLINK so Redis reclaims memory off its main thread. The scan is
+        restricted to the data types the cache type stores.
+        """
+        batch = []
+        async for key in client.scan_iter(
+            match=pattern,
+            count=cls.SCAN_COUNT[cache_type],
+            _type=cls.SCAN_TYPE[cache_type],
+        ):
+            batch.append(key)
+            if len(batch) >= cls.DELETE_BATCH_SIZE:
+                await cls._delete_keys(client, batch)
+                batch = []
+        if batch:
+            await cls._delete_keys(client, batch)
+
+    @classmethod
+    async def _delete_keys(cls, client, keys: List[Any]):
+        """Delete keys, preferring UNLINK unless the batch is small."""
+        if len(keys) > cls.UNLINK_THRESHOLD:
+            await client.unlink(*keys)
+        else:
+            await client.delete(*keys)
 
     async def delete(
         self,
@@ -151,17 +673,10 @@ class CacheManager:
         """
         cache_key = self._generate_key(cache_type, key, prefix)
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                await client.delete(cache_key)
-            except Exception as e:
-                logger.error(f"Redis delete error: {e}")
+        await self._execute("delete", lambda client: client.delete(cache_key))
 
         # Remove from memory cache
-        if cache_key in self.memory_cache:
-            del self.memory_cache[cache_key]
+        self.memory_cache[cache_type].pop(cache_key, None)
 
     async def delete_pattern(
         self,
@@ -176,59 +691,57 @@ class CacheManager:
         """
         full_pattern = self._generate_key(cache_type, pattern)
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                keys = []
-                async for key in client.scan_iter(match=full_pattern):
-                    keys.append(key)
-                if keys:
-                    await client.delete(*keys)
-            except Exception as e:
-                logger.error(f"Redis delete pattern error: {e}")
+        await self._execute(
+            "delete pattern",
+            lambda client: self._delete_matching(client, cache_type, full_pattern),
+        )
 
-        # Remove from memory cache
-        keys_to_delete = [
-            k for k in self.memory_cache.keys()
-            if k.startswith(full_pattern.replace("*", ""))
-        ]
+        # Remove from memory cache (only the relevant bucket is walked)
+        bucket = self.memory_cache[cache_type]
+        key_prefix = full_pattern.replace("*", "")
+        keys_to_delete = [k for k in bucket if k.startswith(key_prefix)]
         for key in keys_to_delete:
-            del self.memory_cache[key]
+            del bucket[key]
 
-    async def clear(self, cache_type: Optional[CacheType] = None):
+    async def clear(
+        self,
+        cache_type: Optional[CacheType] = None,
+        full_flush: bool = False,
+    ):
         """Clear cache.
 
+        Clearing all types walks each type's narrow ``<type>:*`` prefix rather
+        than scanning the whole keyspace with ``*``.
+
         Args:
             cache_type: Optional cache type to clear (clears all if None)
+            full_flush: Flush the whole Redis logical DB instead of scanning.
+                Only use this when the DB is dedicated to the cache, since it
+                also drops rate-limit counters and any other keys stored there.
         """
-        if cache_type:
-            pattern = f"{cache_type.value}:*"
-        else:
-            pattern = "*"
+        if cache_type is None:
+            if full_flush:
+                await self._execute(
+                    "flush",
+                    lambda client: client.flushdb(asynchronous=True),
+                )
+                for bucket in self.memory_cache.values():
+                    bucket.clear()
+                return
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                keys = []
-                async for key in client.scan_iter(match=pattern):
-                    keys.append(key)
-                if keys:
-                    await client.delete(*keys)
-            except Exception as e:
-                logger.error(f"Redis clear error: {e}")
+            for each_type in CacheType:
+                await self.clear(each_type)
+            return
+
+        pattern = f"{cache_type.value}:*"
+
+        await self._execute(
+            "clear",
+            lambda client: self._delete_matching(client, cache_type, pattern),
+        )
 
         # Clear memory cache
-        if cache_type:
-            keys_to_delete = [
-                k for k in self.memory_cache.keys()
-                if k.startswith(f"{cache_type.value}:")
-            ]
-            for key in keys_to_delete:
-                del self.memory_cache[key]
-        else:
-            self.memory_cache.clear()
+        self.memory_cache[cache_type].clear()
 
     async def exists(
         self,
@@ -248,23 +761,14 @@ class CacheManager:
         """
         cache_key = self._generate_key(cache_type, key, prefix)
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                return bool(await client.exists(cache_key))
-            except Exception as e:
-                logger.error(f"Redis exists error: {e}")
-
-        # Check memory cache
-        if cache_key in self.memory_cache:
-            cached_item = self.memory_cache[cache_key]
-            if datetime.utcnow() < cached_item["expires_at"]:
-                return True
-            else:
-                del self.memory_cache[cache_key]
+        async def redis_exists(client):
+            return bool(await client.exists(cache_key))
 
-        return False
+        return await self._execute(
+            "exists",
+            redis_exists,
+            lambda: self._memory_get(cache_type, cache_key) is not None,
+        )
 
     async def get_ttl(
         self,
@@ -284,22 +788,18 @@ class CacheManager:
         """
         cache_key = self._generate_key(cache_type, key, prefix)
 
-        # Try Redis first
-        client = await redis_client.get_client()
-        if client:
-            try:
-                ttl = await client.ttl(cache_key)
-                return ttl if ttl > 0 else None
-            except Exception as e:
-                logger.error(f"Redis TTL error: {e}")
+        async def redis_ttl(client):
+            ttl = await client.ttl(cache_key)
+            return ttl if ttl > 0 else None
 
-        # Check memory cache
-        if cache_key in self.memory_cache:
-            cached_item = self.memory_cache[cache_key]
-            remaining = (cached_item["expires_at"] - datetime.utcnow()).total_seconds()
-            return int(remaining) if remaining > 0 else None
+        def memory_ttl():
+            cached_item = self.memory_cache[cache_type].get(cache_key)
+            if cached_item is not None:
+                remaining = cached_item[0] - time.monotonic()
+                return int(remaining) if remaining > 0 else None
+            return None
 
-        return None
+        return await self._execute("TTL", redis_ttl, memory_ttl)
 
 
 # Global cache manager instance
@@ -1,11 +1,12 @@
 """Cache service for API responses."""
 
-import json
-import hashlib
 from typing import Optional, Any, Dict
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 import logging
 
+import msgspec
+import xxhash
+
 try:
     import redis.asyncio as redis
     REDIS_AVAILABLE = True
@@ -14,6 +15,7 @@ except ImportError:
     logging.warning("Redis not available, using in-memory cache")
 
 from app.core.config import settings
+from app.infrastructure.cache.serialization import enc_hook
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +23,19 @@ logger = logging.getLogger(__name__)
 class CacheService:
     """Cache service for storing API responses."""
 
+    # Connections shared by concurrent commands; callers wait when all are busy
+    MAX_CONNECTIONS = 16
+
     def __init__(self):
         """Initialize cache service."""
         self.redis_client: Optional[redis.Redis] = None
+        self._pool: Optional[redis.BlockingConnectionPool] = None
         self.memory_cache: Dict[str, Dict[str, Any]] = {}
         self.use_redis = REDIS_AVAILABLE and settings.REDIS_URL
+        # MessagePack is smaller than JSON and Redis stores the bytes as-is.
+        # Reused across calls: the encoder keeps its internal write buffer
+        self._encoder = msgspec.msgpack.Encoder(enc_hook=enc_hook)
+        self._decoder = msgspec.msgpack.Decoder()
 
     async def _get_redis_client(self) -> Optional[redis.Redis]:
         """Get or create Redis client."""
@@ -34,10 +44,14 @@ class CacheService:
 
         if self.redis_client is None:
             try:
-                self.redis_client = await redis.from_url(
+                # Each in-flight command checks out its own pooled connection,
+                # so concurrent requests don't queue behind a single socket.
+                self._pool = redis.BlockingConnectionPool.from_url(
                     settings.REDIS_URL,
-                    decode_responses=True,
+                    max_connections=self.MAX_CONNECTIONS,
+                    decode_responses=False,
                 )
+                self.redis_client = redis.Redis(connection_pool=self._pool)
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
                 self.use_redis = False
@@ -47,13 +61,8 @@ class CacheService:
 
     def _generate_key(self, endpoint: str, params: Dict[str, Any] = None) -> str:
         """Generate cache key from endpoint and parameters."""
-        key_data = {"endpoint": endpoint}
-        if params:
-            key_data["params"] = sorted(params.items())
-
-        key_string = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"api_cache:{key_hash}"
+        parts = (endpoint,) + tuple(sorted((params or {}).items()))
+        return f"api_cache:{xxhash.xxh3_64_hexdigest(repr(parts).encode())}"
 
     async def get(
         self,
@@ -77,7 +86,7 @@ class CacheService:
                 try:
                     cached_data = await redis_client.get(cache_key)
                     if cached_data:
-                        return json.loads(cached_data)
+                        return self._decoder.decode(cached_data)
                 except Exception as e:
                     logger.error(f"Redis get error: {e}")
         else:
@@ -93,19 +102,6 @@ class CacheService:
 
         return None
 
-    def _serialize_for_cache(self, obj: Any) -> Any:
-        """Recursively serialize data for JSON caching, handling datetime objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, date):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {k: self._serialize_for_cache(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize_for_cache(item) for item in obj]
-        else:
-            return obj
-
     async def set(
         self,
         endpoint: str,
@@ -122,13 +118,11 @@ class CacheService:
             ttl_seconds: Time to live in seconds (default: 5 minutes)
         """
         cache_key = self._generate_key(endpoint, params)
-        # Serialize data to handle datetime objects
-        serialized_data = self._serialize_for_cache(data)
-        cache_data = json.dumps(serialized_data)
 
         if self.use_redis:
             redis_client = await self._get_redis_client()
             if redis_client:
+                cache_data = self._encoder.encode(data)
                 try:
                     await redis_client.setex(cache_key, ttl_seconds, cache_data)
                 except Exception as e:
@@ -196,6 +190,10 @@ class CacheService:
             await self.redis_client.close()
             self.redis_client = None
 
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
+
 
 # Global cache service instance
 cache_service = CacheService()
@@ -1,16 +1,26 @@
 """Decorator-based caching for FastAPI endpoints."""
 
-import hashlib
-import json
+import asyncio
 import logging
-from typing import Callable, Optional, Any, Dict
+from typing import Callable, Optional, Any, Dict, Set
 from functools import wraps
 from inspect import signature
 
+import xxhash
+
 from app.infrastructure.cache.cache_manager import cache_manager, CacheType
 
 logger = logging.getLogger(__name__)
 
+# Parameters that never contribute to an endpoint's cache key
+_EXCLUDED_PATH_PARAMS = frozenset({'request', 'db', 'service'})
+_EXCLUDED_QUERY_PARAMS = frozenset({'request', 'db', 'service', 'skip', 'limit'})
+
+# Bounds concurrent background invalidations under bursty writes
+_invalidation_semaphore = asyncio.Semaphore(8)
+# Strong references so pending invalidation tasks aren't garbage collected
+_invalidation_tasks: Set[asyncio.Task] = set()
+
 
 def cache_response(
     cache_type: CacheType = CacheType.API_RESPONSE,
@@ -37,36 +47,39 @@ def cache_response(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # Everything derivable from the function itself is computed once here
+        key_seed = (
+            f"{key_prefix}:{func.__name__}" if key_prefix else func.__name__
+        ).encode()
+        # Positional parameter names, with excluded ones blanked out
+        path_params = tuple(
+            None if name in _EXCLUDED_PATH_PARAMS else name
+            for name in signature(func).parameters
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Generate cache key from function name and parameters
-            cache_key_parts = [func.__name__]
+            # Stream key material into a hash seeded with the endpoint prefix
+            key_hash = xxhash.xxh3_64(key_seed)
 
             # Include path parameters
             if include_path_params:
-                sig = signature(func)
-                for param_name, param_value in zip(sig.parameters, args):
-                    if param_name not in ['request', 'db', 'service']:
-                        cache_key_parts.append(f"{param_name}:{param_value}")
+                for param_name, param_value in zip(path_params, args):
+                    if param_name is not None:
+                        key_hash.update(f"|{param_name}:{param_value}".encode())
 
             # Include query parameters from kwargs
             if include_query_params:
-                query_params = {
-                    k: v for k, v in kwargs.items()
-                    if k not in ['request', 'db', 'service', 'skip', 'limit']
-                    and not k.startswith('_')
-                }
-                if query_params:
-                    cache_key_parts.append(json.dumps(query_params, sort_keys=True))
+                for k, v in sorted(kwargs.items()):
+                    if k not in _EXCLUDED_QUERY_PARAMS and not k.startswith('_'):
+                        key_hash.update(f"|{k}={v!r}".encode())
 
             # Include request body if needed
             if include_request_body and 'request' in kwargs:
                 # This would need request body parsing - simplified for now
                 pass
 
-            # Generate cache key hash
-            cache_key_string = "_".join(str(p) for p in cache_key_parts)
-            cache_key = hashlib.md5(cache_key_string.encode()).hexdigest()
+            cache_key = key_hash.hexdigest()
 
             # Try to get from cache
             cached_value = await cache_manager.get(
@@ -151,6 +164,9 @@ def invalidate_cache(
 ):
     """Decorator to invalidate cache after function execution.
 
+    Invalidation runs as a background task once the function returns, so the
+    caller doesn't wait on the SCAN/DEL round trips.
+
     Args:
         cache_type: Type of cache to invalidate
         key_pattern: Pattern to match keys (None = all)
@@ -163,20 +179,31 @@ def invalidate_cache(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        async def invalidate():
+            async with _invalidation_semaphore:
+                try:
+                    if key_pattern:
+                        await cache_manager.delete_pattern(
+                            cache_type=cache_type,
+                            pattern=key_pattern,
+                        )
+                    else:
+                        await cache_manager.clear(cache_type=cache_type)
+                except Exception as e:
+                    logger.error(f"Cache invalidation failed after {func.__name__}: {e}")
+                    return
+
+            logger.info(f"Cache invalidated for {cache_type.value} after {func.__name__}")
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             result = await func(*args, **kwargs)
 
-            # Invalidate cache
-            if key_pattern:
-                await cache_manager.delete_pattern(
-                    cache_type=cache_type,
-                    pattern=key_pattern,
-                )
-            else:
-                await cache_manager.clear(cache_type=cache_type)
+            # Invalidate in the background so the response isn't held up
+            task = asyncio.create_task(invalidate())
+            _invalidation_tasks.add(task)
+            task.add_done_callback(_invalidation_tasks.discard)
 
-            logger.info(f"Cache invalidated for {cache_type.value} after {func.__name__}")
             return result
 
         return wrapper
@@ -34,21 +34,16 @@ class HistoricalDataCache:
         Returns:
             Cache key string
         """
-        key_parts = [data_type]
-        
-        if league_id:
-            key_parts.append(f"league:{league_id}")
-        if team_id:
-            key_parts.append(f"team:{team_id}")
-        if season:
-            key_parts.append(f"season:{season}")
-        
-        # Add any additional parameters
-        for k, v in sorted(kwargs.items()):
-            if v is not None:
-                key_parts.append(f"{k}:{v}")
-        
-        return "_".join(str(p) for p in key_parts)
+        key_parts = (
+            data_type,
+            f"league:{league_id}" if league_id else None,
+            f"team:{team_id}" if team_id else None,
+            f"season:{season}" if season else None,
+            # Add any additional parameters
+            *(f"{k}:{v}" for k, v in sorted(kwargs.items()) if v is not None),
+        )
+
+        return "_".join(p for p in key_parts if p is not None)
 
     @staticmethod
     async def get_standings(
@@ -147,6 +142,40 @@ class HistoricalDataCache:
         logger.debug(f"Team stats cache miss: {cache_key}")
         return None
 
+    @staticmethod
+    async def get_many_team_stats(
+        team_ids: List[int],
+        season: int,
+        period_type: str = "season",
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get cached statistics for several teams in one round trip.
+
+        Args:
+            team_ids: Team IDs
+            season: Season year
+            period_type: Period type (season, month, week)
+
+        Returns:
+            Mapping of team ID to statistics for the teams that were cached
+        """
+        cache_keys = {
+            HistoricalDataCache._generate_key(
+                "team_stats",
+                team_id=team_id,
+                season=season,
+                period_type=period_type,
+            ): team_id
+            for team_id in team_ids
+        }
+
+        cached = await cache_manager.get_many(
+            cache_type=CacheType.HISTORICAL_DATA,
+            keys=list(cache_keys),
+        )
+
+        logger.debug(f"Team stats batch cache: {len(cached)}/{len(cache_keys)} hits")
+        return {cache_keys[key]: value for key, value in cached.items()}
+
     @staticmethod
     async def set_team_stats(
         stats: Dict[str, Any],
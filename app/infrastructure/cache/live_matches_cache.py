@@ -1,19 +1,87 @@
 """Specialized cache for live matches."""
 
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timezone
 
 from app.infrastructure.cache.cache_manager import cache_manager, CacheType
 
 logger = logging.getLogger(__name__)
 
 
+def _utc_timestamp(value: Any) -> Optional[datetime]:
+    """Read a cached updated_at as a naive UTC datetime.
+
+    The cache returns timezone-aware datetimes as datetime objects and
+    everything else as ISO strings, so both forms are accepted.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 class LiveMatchesCache:
-    """Cache manager for live matches with automatic refresh."""
+    """Cache manager for live matches with automatic refresh.
+
+    Each scope is stored as a Redis hash keyed by match ID, so a single match
+    can be read without decoding the whole list.
+
+    Status/score changes are appended to a capped per-match event stream
+    instead of rewriting the hash; reads overlay each match's latest event
+    onto the cached entry.
+
+    Keys embed a generation number. Invalidating every scope is a single
+    INCR of the generation; entries of older generations are never read
+    again and age out through their TTL.
+    """
 
     CACHE_KEY = "live_matches"
+    GENERATION_KEY = "live_matches:gen"
+    GENERATION_REFRESH = 2.0  # seconds the in-process generation is trusted
     DEFAULT_TTL = 60  # 1 minute
+    EVENTS_MAXLEN = 256  # approximate events kept per match
+    EVENTS_TTL = 4 * 3600  # outlives a match, refreshed on every event
+
+    _generation: int = 0
+    _generation_checked_at: float = float("-inf")
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _key(generation: int, league_id: Optional[int], sport: Optional[str]) -> str:
+        """Build the cache key for a scope; the key domain is small and bounded."""
+        if league_id:
+            return f"{LiveMatchesCache.CACHE_KEY}:g{generation}:league:{league_id}"
+        if sport:
+            return f"{LiveMatchesCache.CACHE_KEY}:g{generation}:sport:{sport}"
+        return f"{LiveMatchesCache.CACHE_KEY}:g{generation}"
+
+    @staticmethod
+    def _events_key(match_id: int) -> str:
+        """Build the event stream key for a match (not generation scoped)."""
+        return f"match:{match_id}:events"
+
+    @staticmethod
+    async def _get_generation() -> int:
+        """Return the current generation, re-reading it at most every few seconds."""
+        now = time.monotonic()
+        if now - LiveMatchesCache._generation_checked_at >= LiveMatchesCache.GENERATION_REFRESH:
+            generation = await cache_manager.get_counter(
+                cache_type=CacheType.LIVE_MATCHES,
+                key=LiveMatchesCache.GENERATION_KEY,
+            )
+            if generation is not None:
+                LiveMatchesCache._generation = generation
+            LiveMatchesCache._generation_checked_at = now
+        return LiveMatchesCache._generation
 
     @staticmethod
     async def get_live_matches(
@@ -29,20 +97,27 @@ class LiveMatchesCache:
         Returns:
             List of live matches or None if not cached
         """
-        cache_key = LiveMatchesCache.CACHE_KEY
-        if league_id:
-            cache_key = f"{cache_key}:league:{league_id}"
-        elif sport:
-            cache_key = f"{cache_key}:sport:{sport}"
+        generation = await LiveMatchesCache._get_generation()
+        cache_key = LiveMatchesCache._key(generation, league_id, sport)
 
-        cached = await cache_manager.get(
+        cached = await cache_manager.hgetall(
             cache_type=CacheType.LIVE_MATCHES,
             key=cache_key,
         )
 
         if cached:
             logger.debug(f"Live matches cache hit: {cache_key}")
-            return cached
+            match_ids = [int(field) for field in cached if field.isdigit()]
+            latest = await LiveMatchesCache.get_match_events(match_ids)
+            for match_id, events in latest.items():
+                match = cached[str(match_id)]
+                event = events[0]
+                # Skip events older than the entry, e.g. from before a refresh
+                event_at = _utc_timestamp(event.get("updated_at"))
+                match_at = _utc_timestamp(match.get("updated_at"))
+                if event_at is not None and (match_at is None or event_at > match_at):
+                    cached[str(match_id)] = {**match, **event}
+            return list(cached.values())
 
         logger.debug(f"Live matches cache miss: {cache_key}")
         return None
@@ -62,20 +137,36 @@ class LiveMatchesCache:
             sport: Optional sport filter
             ttl: Time to live in seconds
         """
-        cache_key = LiveMatchesCache.CACHE_KEY
-        if league_id:
-            cache_key = f"{cache_key}:league:{league_id}"
-        elif sport:
-            cache_key = f"{cache_key}:sport:{sport}"
+        await LiveMatchesCache.set_many([((league_id, sport), matches)], ttl=ttl)
+
+    @staticmethod
+    async def set_many(
+        entries: List[Tuple[Tuple[Optional[int], Optional[str]], List[Dict[str, Any]]]],
+        ttl: int = DEFAULT_TTL,
+    ):
+        """Cache live matches for several scopes in one round trip.
 
-        await cache_manager.set(
+        Args:
+            entries: List of ((league_id, sport), matches) pairs
+            ttl: Time to live in seconds
+        """
+        generation = await LiveMatchesCache._get_generation()
+        hashes = {}
+        for (league_id, sport), matches in entries:
+            cache_key = LiveMatchesCache._key(generation, league_id, sport)
+            hashes[cache_key] = {
+                str(match.get("id", index)): match
+                for index, match in enumerate(matches)
+            }
+
+        await cache_manager.hset_batch(
             cache_type=CacheType.LIVE_MATCHES,
-            key=cache_key,
-            value=matches,
+            hashes=hashes,
             ttl=ttl,
         )
 
-        logger.info(f"Live matches cached: {cache_key} ({len(matches)} matches)")
+        for cache_key, mapping in hashes.items():
+            logger.info(f"Live matches cached: {cache_key} ({len(mapping)} matches)")
 
     @staticmethod
     async def invalidate_live_matches(
@@ -88,23 +179,22 @@ class LiveMatchesCache:
             league_id: Optional league ID filter
             sport: Optional sport filter
         """
-        if league_id:
-            cache_key = f"{LiveMatchesCache.CACHE_KEY}:league:{league_id}"
+        generation = await LiveMatchesCache._get_generation()
+        if league_id or sport:
             await cache_manager.delete(
                 cache_type=CacheType.LIVE_MATCHES,
-                key=cache_key,
-            )
-        elif sport:
-            cache_key = f"{LiveMatchesCache.CACHE_KEY}:sport:{sport}"
-            await cache_manager.delete(
-                cache_type=CacheType.LIVE_MATCHES,
-                key=cache_key,
+                key=LiveMatchesCache._key(generation, league_id, sport),
             )
         else:
-            await cache_manager.delete_pattern(
+            # Move every scope to a fresh generation instead of scanning for keys
+            new_generation = await cache_manager.incr(
                 cache_type=CacheType.LIVE_MATCHES,
-                pattern=f"{LiveMatchesCache.CACHE_KEY}*",
+                key=LiveMatchesCache.GENERATION_KEY,
             )
+            if new_generation is None:
+                new_generation = generation + 1
+            LiveMatchesCache._generation = new_generation
+            LiveMatchesCache._generation_checked_at = time.monotonic()
 
         logger.info(f"Live matches cache invalidated: league_id={league_id}, sport={sport}")
 
@@ -114,27 +204,50 @@ class LiveMatchesCache:
         status: str,
         scores: Optional[Dict[str, int]] = None,
     ):
-        """Update a specific match in live matches cache.
+        """Record a status/score change for a match.
+
+        The change is appended to the match's event stream and applied to
+        cached entries when they are read.
 
         Args:
             match_id: Match ID to update
             status: New status
             scores: Optional scores dictionary
         """
-        # Get all cached live matches
-        cached_matches = await LiveMatchesCache.get_live_matches()
-
-        if cached_matches:
-            # Find and update the match
-            for match in cached_matches:
-                if match.get("id") == match_id:
-                    match["status"] = status
-                    if scores:
-                        match.update(scores)
-                    match["updated_at"] = datetime.utcnow().isoformat()
-
-                    # Re-cache with updated data
-                    await LiveMatchesCache.set_live_matches(cached_matches)
-                    logger.info(f"Updated match {match_id} in live matches cache")
-                    break
+        patch = {
+            "status": status,
+            **(scores or {}),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+
+        await cache_manager.xadd(
+            cache_type=CacheType.LIVE_MATCHES,
+            key=LiveMatchesCache._events_key(match_id),
+            value=patch,
+            maxlen=LiveMatchesCache.EVENTS_MAXLEN,
+            ttl=LiveMatchesCache.EVENTS_TTL,
+        )
+
+        logger.info(f"Recorded status update for match {match_id}")
 
+    @staticmethod
+    async def get_match_events(
+        match_ids: List[int],
+        count: int = 1,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get the most recent status/score events for several matches.
+
+        Args:
+            match_ids: Match IDs to read
+            count: Number of events per match
+
+        Returns:
+            Mapping of match ID to its events, newest first
+        """
+        keys = {LiveMatchesCache._events_key(match_id): match_id for match_id in match_ids}
+        events = await cache_manager.xrevrange_many(
+            cache_type=CacheType.LIVE_MATCHES,
+            keys=list(keys),
+            count=count,
+        )
+        return {keys[key]: match_events for key, match_events in events.items()}
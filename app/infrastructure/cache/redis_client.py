@@ -14,44 +14,61 @@ class RedisClient:
     """Redis client singleton with connection pooling."""
 
     _instance: Optional[Redis] = None
+    _client: Optional[Redis] = None
     _pool: Optional[ConnectionPool] = None
 
+    @property
+    def instance(self) -> Optional[Redis]:
+        """The shared client created at startup, without re-entering get_client.
+
+        Hot paths read this attribute directly; it is None until get_client has
+        connected successfully (normally in the application lifespan).
+        """
+        return type(self)._instance
+
     @classmethod
     async def get_client(cls) -> Optional[Redis]:
         """Get or create Redis client instance."""
         if cls._instance is None:
             try:
-                # Create connection pool
-                cls._pool = ConnectionPool.from_url(
-                    settings.REDIS_URL,
-                    max_connections=50,
-                    decode_responses=True,
-                    retry_on_timeout=True,
-                    health_check_interval=30,
-                )
-                
-                # Create Redis client from pool
-                cls._instance = Redis(connection_pool=cls._pool)
-                
-                # Test connection
-                await cls._instance.ping()
+                # The pool and client wrapper are built once and kept across
+                # failed pings, so reconnect attempts don't pay for a new
+                # Redis() (and its response-callback table) every time.
+                if cls._client is None:
+                    # redis-py picks the hiredis C parser automatically when
+                    # it is installed; the socket timeouts make a dead server
+                    # fail fast instead of stalling the event loop.
+                    cls._pool = ConnectionPool.from_url(
+                        settings.REDIS_URL,
+                        max_connections=50,
+                        socket_connect_timeout=1,
+                        socket_timeout=2,
+                        # Replies stay as bytes; the cache decoders parse bytes directly
+                        decode_responses=False,
+                        retry_on_timeout=True,
+                        health_check_interval=30,
+                    )
+                    cls._client = Redis(connection_pool=cls._pool)
+
+                # Only publish the client once the server has answered
+                await cls._client.ping()
+                cls._instance = cls._client
                 logger.info("Redis connection established successfully")
-                
+
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
                 logger.warning("Falling back to in-memory cache")
-                cls._instance = None
-                cls._pool = None
 
         return cls._instance
 
     @classmethod
     async def close(cls):
         """Close Redis connection and pool."""
-        if cls._instance:
-            await cls._instance.close()
+        if cls._client:
+            await cls._client.close()
+            cls._client = None
             cls._instance = None
-        
+
         if cls._pool:
             await cls._pool.disconnect()
             cls._pool = None
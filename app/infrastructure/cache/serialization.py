@@ -0,0 +1,24 @@
+"""Shared serialization helpers for cache payloads."""
+
+from typing import Any
+
+
+def enc_hook(obj: Any) -> Any:
+    """Convert types msgspec can't encode natively.
+
+    datetimes, dates, times, UUIDs and Decimals are encoded by msgspec itself
+    and this hook never sees them. Payloads are decoded without a type, so not
+    every value comes back as it went in:
+
+    - timezone-aware datetimes are stored as msgpack timestamps and come back
+      as UTC ``datetime`` objects
+    - naive datetimes, dates, times, UUIDs and Decimals are stored as strings
+      (ISO format for the temporal types) and come back as ``str``
+
+    Code comparing a cached value with a freshly computed one must normalize
+    both sides first. Anything else reaching this hook is stored as its
+    ``isoformat()`` or ``str()``.
+    """
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
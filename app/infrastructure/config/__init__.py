@@ -2,8 +2,8 @@
 
 from app.infrastructure.config.probability_config_service import (
     ProbabilityConfigService,
-    config_service,
+    get_config_service,
 )
 
-__all__ = ["ProbabilityConfigService", "config_service"]
+__all__ = ["ProbabilityConfigService", "get_config_service"]
 
@@ -12,7 +12,8 @@ engine = create_async_engine(
     future=True,
 )
 
-# Create async session factory
+# Create async session factory; instances stay loaded after commit so
+# returning them from a handler does not trigger a re-SELECT
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -0,0 +1,118 @@
+"""Bulk ingest helpers for high-volume tables."""
+
+import logging
+from typing import Any, Dict, List
+
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models.match_stat_model import MatchStatModel, STAT_DEFAULTS
+from app.infrastructure.database.session import mark_session_dirty
+
+logger = logging.getLogger(__name__)
+
+# Below this many rows a plain executemany INSERT is cheaper than COPY setup
+COPY_THRESHOLD = 100
+
+# Filled by the database itself (serial id and server-side timestamps)
+_SERVER_GENERATED_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+
+# Left untouched when an upsert hits an existing row
+_UPSERT_KEEP_COLUMNS = frozenset({"id", "created_at", "match_id", "team_id"})
+
+
+def _to_stat_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold flat statistic keys (e.g. ``corners``) into the ``stats`` column."""
+    stat_row = {"stats": dict(row.get("stats") or {})}
+    for key, value in row.items():
+        if key in STAT_DEFAULTS:
+            stat_row["stats"][key] = value
+        elif key != "stats":
+            stat_row[key] = value
+    return stat_row
+
+
+def _copy_columns() -> List[str]:
+    """Columns written by COPY, in table order."""
+    return [
+        column.name for column in MatchStatModel.__table__.columns
+        if column.name not in _SERVER_GENERATED_COLUMNS
+    ]
+
+
+async def bulk_copy_match_stats(session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """Insert match statistics rows, using PostgreSQL COPY for large batches.
+
+    COPY skips SQLAlchemy's Python-side processing, so ``stats`` is encoded
+    here; timestamps come from the server defaults.
+
+    Args:
+        session: Database session (the rows join its transaction)
+        rows: Match statistics keyed by column or statistic name
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    stat_rows = [_to_stat_row(row) for row in rows]
+
+    if len(stat_rows) < COPY_THRESHOLD:
+        await session.execute(insert(MatchStatModel), stat_rows)
+        return len(stat_rows)
+
+    names = _copy_columns()
+    # SQLAlchemy's asyncpg JSONB codec takes the JSON text
+    records = [
+        tuple(
+            orjson.dumps(row["stats"], default=float).decode() if name == "stats" else row.get(name)
+            for name in names
+        )
+        for row in stat_rows
+    ]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        MatchStatModel.__tablename__,
+        records=records,
+        columns=names,
+    )
+    # COPY bypasses the session's statement events
+    mark_session_dirty(session)
+
+    logger.info(f"Copied {len(records)} match statistics rows")
+    return len(records)
+
+
+async def upsert_match_stats(session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """Insert or update match statistics in a single statement.
+
+    Rows are matched on (match_id, team_id); existing rows get the supplied
+    statistics merged into ``stats`` and updated_at refreshed.
+
+    Args:
+        session: Database session
+        rows: Match statistics keyed by column or statistic name; all rows
+            share the same keys
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    stmt = pg_insert(MatchStatModel)
+    set_ = {
+        column.name: stmt.excluded[column.name]
+        for column in MatchStatModel.__table__.columns
+        if column.name not in _UPSERT_KEEP_COLUMNS
+    }
+    set_["stats"] = MatchStatModel.__table__.c.stats.op("||")(stmt.excluded.stats)
+    stmt = stmt.on_conflict_do_update(constraint="uq_match_stat_match_team", set_=set_)
+
+    await session.execute(stmt, [_to_stat_row(row) for row in rows])
+    return len(rows)
@@ -1,7 +1,6 @@
 """API key database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, Boolean, Index
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, Index, func
 
 from app.infrastructure.database.base import Base
 
@@ -10,6 +9,7 @@ class APIKeyModel(Base):
     """API key database model."""
 
     __tablename__ = "api_keys"
+    __mapper_args__ = {"eager_defaults": True}
 
     key_id = Column(String(50), primary_key=True, index=True)
     key_hash = Column(String(64), nullable=False, unique=True, index=True)  # SHA256 hash
@@ -18,7 +18,7 @@ class APIKeyModel(Base):
     rate_limit_per_minute = Column(Integer, default=60, nullable=False)
     rate_limit_per_hour = Column(Integer, default=1000, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_used = Column(DateTime(timezone=True), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
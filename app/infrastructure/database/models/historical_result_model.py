@@ -1,7 +1,6 @@
 """Historical results database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Boolean, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Boolean, Index, SmallInteger, text, func
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.base import Base
@@ -11,6 +10,7 @@ class HistoricalResultModel(Base):
     """Historical results database model for aggregated statistics."""
 
     __tablename__ = "historical_results"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -23,31 +23,31 @@ class HistoricalResultModel(Base):
     period_end = Column(DateTime, nullable=True)
     
     # Match statistics
-    matches_played = Column(Integer, default=0, nullable=False)
-    matches_won = Column(Integer, default=0, nullable=False)
-    matches_drawn = Column(Integer, default=0, nullable=False)
-    matches_lost = Column(Integer, default=0, nullable=False)
+    matches_played = Column(SmallInteger, default=0, nullable=False)
+    matches_won = Column(SmallInteger, default=0, nullable=False)
+    matches_drawn = Column(SmallInteger, default=0, nullable=False)
+    matches_lost = Column(SmallInteger, default=0, nullable=False)
     
     # Goals/Points
-    goals_for = Column(Integer, default=0, nullable=False)
-    goals_against = Column(Integer, default=0, nullable=False)
-    goal_difference = Column(Integer, default=0, nullable=False)
-    points = Column(Integer, default=0, nullable=False)  # League points
+    goals_for = Column(SmallInteger, default=0, nullable=False)
+    goals_against = Column(SmallInteger, default=0, nullable=False)
+    goal_difference = Column(SmallInteger, default=0, nullable=False)
+    points = Column(SmallInteger, default=0, nullable=False)  # League points
     
     # Home/Away split
-    home_matches_played = Column(Integer, default=0, nullable=False)
-    home_matches_won = Column(Integer, default=0, nullable=False)
-    home_matches_drawn = Column(Integer, default=0, nullable=False)
-    home_matches_lost = Column(Integer, default=0, nullable=False)
-    home_goals_for = Column(Integer, default=0, nullable=False)
-    home_goals_against = Column(Integer, default=0, nullable=False)
+    home_matches_played = Column(SmallInteger, default=0, nullable=False)
+    home_matches_won = Column(SmallInteger, default=0, nullable=False)
+    home_matches_drawn = Column(SmallInteger, default=0, nullable=False)
+    home_matches_lost = Column(SmallInteger, default=0, nullable=False)
+    home_goals_for = Column(SmallInteger, default=0, nullable=False)
+    home_goals_against = Column(SmallInteger, default=0, nullable=False)
     
-    away_matches_played = Column(Integer, default=0, nullable=False)
-    away_matches_won = Column(Integer, default=0, nullable=False)
-    away_matches_drawn = Column(Integer, default=0, nullable=False)
-    away_matches_lost = Column(Integer, default=0, nullable=False)
-    away_goals_for = Column(Integer, default=0, nullable=False)
-    away_goals_against = Column(Integer, default=0, nullable=False)
+    away_matches_played = Column(SmallInteger, default=0, nullable=False)
+    away_matches_won = Column(SmallInteger, default=0, nullable=False)
+    away_matches_drawn = Column(SmallInteger, default=0, nullable=False)
+    away_matches_lost = Column(SmallInteger, default=0, nullable=False)
+    away_goals_for = Column(SmallInteger, default=0, nullable=False)
+    away_goals_against = Column(SmallInteger, default=0, nullable=False)
     
     # Performance metrics
     win_percentage = Column(Numeric(5, 2), nullable=True)
@@ -55,9 +55,9 @@ class HistoricalResultModel(Base):
     average_goals_against = Column(Numeric(5, 2), nullable=True)
     
     # Streaks
-    current_win_streak = Column(Integer, default=0, nullable=False)
-    current_loss_streak = Column(Integer, default=0, nullable=False)
-    current_unbeaten_streak = Column(Integer, default=0, nullable=False)
+    current_win_streak = Column(SmallInteger, default=0, nullable=False)
+    current_loss_streak = Column(SmallInteger, default=0, nullable=False)
+    current_unbeaten_streak = Column(SmallInteger, default=0, nullable=False)
     
     # League position
     league_position = Column(Integer, nullable=True, index=True)
@@ -65,8 +65,13 @@ class HistoricalResultModel(Base):
     # Metadata
     last_updated_match_id = Column(Integer, ForeignKey("matches.id", ondelete="SET NULL"), nullable=True)
     is_final = Column(Boolean, default=False, nullable=False, index=True)  # True when period is complete
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False,
+    )
 
     # Relationships
     league = relationship("LeagueModel", back_populates="historical_results")
@@ -81,5 +86,12 @@ class HistoricalResultModel(Base):
         Index("idx_historical_season_position", "season", "league_position"),
         Index("idx_historical_league_season_position", "league_id", "season", "league_position"),
         Index("idx_historical_period_type", "period_type", "season"),
+        Index(
+            "idx_historical_active",
+            "league_id",
+            "season",
+            "league_position",
+            postgresql_where=text("is_final = false"),
+        ),
     )
 
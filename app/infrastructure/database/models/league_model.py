@@ -1,7 +1,6 @@
 """League database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index, func
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.base import Base
@@ -11,6 +10,7 @@ class LeagueModel(Base):
     """League database model."""
 
     __tablename__ = "leagues"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True, index=True)
@@ -25,13 +25,18 @@ class LeagueModel(Base):
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     season_start_month = Column(Integer, nullable=True)  # 1-12
     season_end_month = Column(Integer, nullable=True)  # 1-12
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False,
+    )
 
     # Relationships
-    teams = relationship("TeamModel", back_populates="league", cascade="all, delete-orphan")
-    matches = relationship("MatchModel", back_populates="league", cascade="all, delete-orphan")
-    historical_results = relationship("HistoricalResultModel", back_populates="league", cascade="all, delete-orphan")
+    teams = relationship("TeamModel", back_populates="league", cascade="all, delete-orphan", passive_deletes=True)
+    matches = relationship("MatchModel", back_populates="league", cascade="all, delete-orphan", passive_deletes=True)
+    historical_results = relationship("HistoricalResultModel", back_populates="league", cascade="all, delete-orphan", passive_deletes=True)
 
     # Composite indexes for common queries
     __table_args__ = (
@@ -1,7 +1,6 @@
 """Match database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Numeric, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Numeric, Index, text, func
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.base import Base
@@ -11,6 +10,7 @@ class MatchModel(Base):
     """Match database model."""
 
     __tablename__ = "matches"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -41,14 +41,19 @@ class MatchModel(Base):
     referee = Column(String(100), nullable=True)
     notes = Column(String(500), nullable=True)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False,
+    )
 
     # Relationships
     league = relationship("LeagueModel", back_populates="matches")
     home_team = relationship("TeamModel", foreign_keys=[home_team_id], back_populates="home_matches")
     away_team = relationship("TeamModel", foreign_keys=[away_team_id], back_populates="away_matches")
-    match_stats = relationship("MatchStatModel", back_populates="match", cascade="all, delete-orphan")
+    match_stats = relationship("MatchStatModel", back_populates="match", cascade="all, delete-orphan", passive_deletes=True)
 
     # Composite indexes for common queries
     __table_args__ = (
@@ -59,4 +64,10 @@ class MatchModel(Base):
         Index("idx_match_date_status", "match_date", "status"),
         Index("idx_match_team_season", "home_team_id", "season"),
         Index("idx_match_away_team_season", "away_team_id", "season"),
+        Index(
+            "idx_match_live",
+            "league_id",
+            "match_date",
+            postgresql_where=text("status = 'live'"),
+        ),
     )
@@ -1,75 +1,110 @@
 """Match statistics database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Boolean, Index
+from typing import Any, Dict
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Boolean, Index, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.base import Base
 
+# Per-sport statistics stored in the ``stats`` JSONB column, with the value
+# reported when a statistic is absent. Rows only carry the keys for their sport.
+STAT_DEFAULTS: Dict[str, Any] = {
+    # General statistics
+    "possession_percent": None,
+    "total_shots": 0,
+    "shots_on_target": 0,
+    "shots_off_target": 0,
+    "corners": 0,
+    "fouls": 0,
+    "yellow_cards": 0,
+    "red_cards": 0,
+    "offsides": 0,
+
+    # Football/Soccer specific
+    "passes_total": 0,
+    "passes_accurate": 0,
+    "pass_accuracy": None,
+    "crosses_total": 0,
+    "crosses_accurate": 0,
+
+    # Basketball specific
+    "field_goals_made": 0,
+    "field_goals_attempted": 0,
+    "three_pointers_made": 0,
+    "three_pointers_attempted": 0,
+    "free_throws_made": 0,
+    "free_throws_attempted": 0,
+    "rebounds_offensive": 0,
+    "rebounds_defensive": 0,
+    "rebounds_total": 0,
+    "assists": 0,
+    "steals": 0,
+    "blocks": 0,
+    "turnovers": 0,
+    "personal_fouls": 0,
+
+    # American Football specific
+    "first_downs": 0,
+    "rushing_yards": 0,
+    "passing_yards": 0,
+    "total_yards": 0,
+    "penalties": 0,
+    "penalty_yards": 0,
+    "time_of_possession": None,  # Format: "MM:SS"
+
+    # Baseball specific
+    "hits": 0,
+    "runs": 0,
+    "errors": 0,
+    "strikeouts": 0,
+    "walks": 0,
+}
+
+
+def _stat_property(name: str, default: Any) -> property:
+    """Expose one statistic from ``stats`` as a regular attribute."""
+
+    def getter(self):
+        return (self.stats or {}).get(name, default)
+
+    def setter(self, value):
+        if self.stats is None:
+            self.stats = {}
+        self.stats[name] = value
+
+    return property(getter, setter, doc=f"``{name}`` statistic.")
+
 
 class MatchStatModel(Base):
     """Match statistics database model."""
 
     __tablename__ = "match_stats"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     match_id = Column(Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False, index=True)
     team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
-    
-    # General statistics
-    possession_percent = Column(Numeric(5, 2), nullable=True)
-    total_shots = Column(Integer, default=0, nullable=False)
-    shots_on_target = Column(Integer, default=0, nullable=False)
-    shots_off_target = Column(Integer, default=0, nullable=False)
-    corners = Column(Integer, default=0, nullable=False)
-    fouls = Column(Integer, default=0, nullable=False)
-    yellow_cards = Column(Integer, default=0, nullable=False)
-    red_cards = Column(Integer, default=0, nullable=False)
-    offsides = Column(Integer, default=0, nullable=False)
-    
-    # Football/Soccer specific
-    passes_total = Column(Integer, default=0, nullable=False)
-    passes_accurate = Column(Integer, default=0, nullable=False)
-    pass_accuracy = Column(Numeric(5, 2), nullable=True)
-    crosses_total = Column(Integer, default=0, nullable=False)
-    crosses_accurate = Column(Integer, default=0, nullable=False)
-    
-    # Basketball specific
-    field_goals_made = Column(Integer, default=0, nullable=False)
-    field_goals_attempted = Column(Integer, default=0, nullable=False)
-    three_pointers_made = Column(Integer, default=0, nullable=False)
-    three_pointers_attempted = Column(Integer, default=0, nullable=False)
-    free_throws_made = Column(Integer, default=0, nullable=False)
-    free_throws_attempted = Column(Integer, default=0, nullable=False)
-    rebounds_offensive = Column(Integer, default=0, nullable=False)
-    rebounds_defensive = Column(Integer, default=0, nullable=False)
-    rebounds_total = Column(Integer, default=0, nullable=False)
-    assists = Column(Integer, default=0, nullable=False)
-    steals = Column(Integer, default=0, nullable=False)
-    blocks = Column(Integer, default=0, nullable=False)
-    turnovers = Column(Integer, default=0, nullable=False)
-    personal_fouls = Column(Integer, default=0, nullable=False)
-    
-    # American Football specific
-    first_downs = Column(Integer, default=0, nullable=False)
-    rushing_yards = Column(Integer, default=0, nullable=False)
-    passing_yards = Column(Integer, default=0, nullable=False)
-    total_yards = Column(Integer, default=0, nullable=False)
-    penalties = Column(Integer, default=0, nullable=False)
-    penalty_yards = Column(Integer, default=0, nullable=False)
-    time_of_possession = Column(String(10), nullable=True)  # Format: "MM:SS"
-    
-    # Baseball specific
-    hits = Column(Integer, default=0, nullable=False)
-    runs = Column(Integer, default=0, nullable=False)
-    errors = Column(Integer, default=0, nullable=False)
-    strikeouts = Column(Integer, default=0, nullable=False)
-    walks = Column(Integer, default=0, nullable=False)
-    
+
+    # Sport-specific statistics (see STAT_DEFAULTS)
+    stats = Column(
+        MutableDict.as_mutable(JSONB),
+        default=lambda: {},
+        server_default=text("'{}'::jsonb"),
+        nullable=False,
+    )
+
     # Metadata
     is_home_team = Column(Boolean, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False,
+    )
 
     # Relationships
     match = relationship("MatchModel", back_populates="match_stats")
@@ -77,8 +112,21 @@ class MatchStatModel(Base):
 
     # Composite indexes for common queries
     __table_args__ = (
-        Index("idx_match_stat_match_team", "match_id", "team_id"),
-        Index("idx_match_stat_team_match", "team_id", "match_id"),
+        # One row per team per match; its index also serves (match_id, team_id) lookups
+        UniqueConstraint("match_id", "team_id", name="uq_match_stat_match_team"),
         Index("idx_match_stat_match_home", "match_id", "is_home_team"),
+        # Rows arrive in time order, so a BRIN index serves "recent rows"
+        # scans in a few pages (a now()-based partial index isn't allowed)
+        Index("idx_match_stat_created_brin", "created_at", postgresql_using="brin"),
+        # Containment queries, e.g. stats @> '{"corners": 5}'
+        Index(
+            "idx_match_stat_stats_gin",
+            "stats",
+            postgresql_using="gin",
+            postgresql_ops={"stats": "jsonb_path_ops"},
+        ),
     )
 
+
+for _name, _default in STAT_DEFAULTS.items():
+    setattr(MatchStatModel, _name, _stat_property(_name, _default))
@@ -1,7 +1,7 @@
 """Team database model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.infrastructure.database.base import Base
@@ -11,41 +11,56 @@ class TeamModel(Base):
     """Team database model."""
 
     __tablename__ = "teams"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
-    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False, index=True)
     code = Column(String(10), nullable=True, unique=True, index=True)
     city = Column(String(100), nullable=True, index=True)
-    conference = Column(String(50), nullable=True, index=True)
+    conference = Column(String(50), nullable=True)
     division = Column(String(50), nullable=True, index=True)
     founded_year = Column(Integer, nullable=True)
     logo_url = Column(String(500), nullable=True)
     stadium_name = Column(String(200), nullable=True)
     stadium_capacity = Column(Integer, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Running sums of numeric match statistics plus a "matches" count, kept up
+    # to date by a trigger on match_stats (migration 011); read-only here
+    season_totals = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)
+    created_at = Column(DateTime, server_default=func.timezone('utc', func.now()), nullable=False)
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone('utc', func.now()),
+        onupdate=func.timezone('utc', func.now()),
+        nullable=False,
+    )
 
-    # Relationships
+    # Relationships; child rows are removed by the database's ON DELETE CASCADE.
+    # Collections raise on lazy access so query sites pick a loader (selectinload)
     league = relationship("LeagueModel", back_populates="teams")
-    players = relationship("PlayerModel", back_populates="team", cascade="all, delete-orphan")
+    players = relationship("PlayerModel", back_populates="team", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
     home_matches = relationship(
         "MatchModel",
         foreign_keys="MatchModel.home_team_id",
         back_populates="home_team",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     away_matches = relationship(
         "MatchModel",
         foreign_keys="MatchModel.away_team_id",
         back_populates="away_team",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
-    match_stats = relationship("MatchStatModel", back_populates="team", cascade="all, delete-orphan")
-    historical_results = relationship("HistoricalResultModel", back_populates="team", cascade="all, delete-orphan")
+    match_stats = relationship("MatchStatModel", back_populates="team", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    historical_results = relationship("HistoricalResultModel", back_populates="team", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     # Composite indexes for common queries
+    # league_id and conference lookups use the leading column of these
     __table_args__ = (
         Index("idx_team_league_active", "league_id", "is_active"),
         Index("idx_team_conference_division", "conference", "division"),
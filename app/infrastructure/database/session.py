@@ -1,20 +1,51 @@
 """Database session management."""
 
 from typing import AsyncGenerator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.infrastructure.database.base import AsyncSessionLocal
 
+# session.info flag set once a session has written something
+_HAS_WRITES = "has_writes"
+
+
+def mark_session_dirty(session: AsyncSession) -> None:
+    """Record a write made outside the ORM (e.g. COPY on the raw connection)."""
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    """Flag sessions that flushed pending changes."""
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    """Flag sessions that executed anything other than a SELECT."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session."""
+    """Get database session.
+
+    The transaction is committed only if the request wrote something;
+    read-only requests end with a (no-op) rollback instead of a COMMIT.
+    Handlers must turn ORM instances into DTOs before returning; ORM
+    objects should not outlive this dependency's scope.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if session.info.get(_HAS_WRITES):
+                await session.commit()
+            else:
+                await session.rollback()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
-
@@ -1,13 +1,17 @@
 """Base API client for external services."""
 
 import asyncio
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import httpx
 from httpx import AsyncClient, Response
 import logging
 
+import orjson
+
 from app.core.config import settings
+from app.infrastructure.external.throttle import jittered_backoff
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,17 @@ class RateLimitError(APIError):
 class APIClient:
     """Base API client with retry logic and rate limiting."""
 
+    # HTTP connection pool
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    KEEPALIVE_EXPIRY = 60
+
+    # Most recent responses kept for conditional (ETag/Last-Modified) GETs
+    VALIDATOR_CACHE_SIZE = 256
+
+    # Upper bound on a single retry wait, in seconds
+    MAX_RETRY_DELAY = 30.0
+
     def __init__(
         self,
         base_url: str,
@@ -57,56 +72,106 @@ class APIClient:
         self.retry_delay = retry_delay
         self.rate_limit_per_minute = rate_limit_per_minute
 
-        # Rate limiting tracking
-        self.request_times: List[datetime] = []
-        self._rate_limit_lock = asyncio.Lock()
+        # Token bucket: one token per request, refilled at the per-minute rate.
+        # Tokens are topped up from elapsed time when a request is made, so no
+        # background task outlives the client.
+        self._tokens = float(rate_limit_per_minute)
+        self._tokens_updated_at = time.monotonic()
 
         # HTTP client
         self.client: Optional[AsyncClient] = None
 
+        # Conditional GETs: request key -> (ETag, Last-Modified, body)
+        self._validators: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request, set once on the HTTP client."""
+        headers = {}
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+        return headers
+
     async def _get_client(self) -> AsyncClient:
         """Get or create HTTP client."""
         if self.client is None:
-            headers = {}
-            if self.api_key:
-                headers["X-API-Key"] = self.api_key
-
+            # One pooled HTTP/2 client is reused for every request and retry;
+            # retries are handled in _make_request, not by the transport.
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                retries=0,
+            )
             self.client = AsyncClient(
                 base_url=self.base_url,
-                headers=headers,
-                timeout=self.timeout,
+                headers=self._default_headers(),
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                transport=transport,
             )
         return self.client
 
     async def _check_rate_limit(self):
         """Check and enforce rate limiting."""
-        async with self._rate_limit_lock:
-            now = datetime.utcnow()
-            # Remove requests older than 1 minute
-            self.request_times = [
-                t for t in self.request_times
-                if now - t < timedelta(minutes=1)
-            ]
-
-            if len(self.request_times) >= self.rate_limit_per_minute:
-                # Calculate wait time
-                oldest_request = min(self.request_times)
-                wait_until = oldest_request + timedelta(minutes=1)
-                wait_seconds = (wait_until - now).total_seconds()
-
-                if wait_seconds > 0:
-                    logger.warning(
-                        f"Rate limit reached. Waiting {wait_seconds:.2f} seconds."
-                    )
-                    await asyncio.sleep(wait_seconds)
-                    # Clean up again after waiting
-                    self.request_times = [
-                        t for t in self.request_times
-                        if now - t < timedelta(minutes=1)
-                    ]
+        while True:
+            now = time.monotonic()
+            elapsed = now - self._tokens_updated_at
+            self._tokens = min(
+                float(self.rate_limit_per_minute),
+                self._tokens + elapsed * self.rate_limit_per_minute / 60.0,
+            )
+            self._tokens_updated_at = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            logger.warning("Rate limit reached. Waiting for a request token.")
+            await asyncio.sleep((1.0 - self._tokens) * 60.0 / self.rate_limit_per_minute)
+
+    def _backoff(self, attempt: int, floor: float = 0.0) -> float:
+        """Compute a retry wait using capped exponential backoff with full jitter.
+
+        Randomizing the whole wait spreads retries from concurrent callers
+        instead of having them hit the API again in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number
+            floor: Minimum wait (e.g. from a Retry-After header)
+
+        Returns:
+            Seconds to wait
+        """
+        return max(floor, jittered_backoff(attempt, self.retry_delay, self.MAX_RETRY_DELAY))
+
+    @staticmethod
+    def _parse_error_body(response: Response) -> Tuple[Dict[str, Any], str]:
+        """Extract error details from an error response.
+
+        The body bytes are decoded at most once: as JSON if possible,
+        otherwise as text.
 
-            # Record this request
-            self.request_times.append(datetime.utcnow())
+        Args:
+            response: HTTP error response
+
+        Returns:
+            Tuple of (error data, error message)
+        """
+        body = response.content
+        try:
+            error_data = orjson.loads(body)
+            return error_data, error_data.get('message', 'Unknown error')
+        except Exception:
+            pass
+
+        # If response is HTML or plain text, extract a concise message
+        text = body.decode("utf-8", errors="replace").strip()
+        if not text or text.startswith('<!DOCTYPE') or text.startswith('<html'):
+            error_message = f"HTTP {response.status_code} - {response.reason_phrase}"
+        else:
+            # Truncate long text responses
+            error_message = text[:500]
+        return {"message": error_message}, error_message
 
     async def _make_request(
         self,
@@ -132,12 +197,9 @@ class APIClient:
             APIError: If request fails after retries
             RateLimitError: If rate limit is exceeded
         """
+        # Endpoints resolve against the client's base_url, and the auth
+        # headers are client defaults, so nothing is rebuilt per request
         client = await self._get_client()
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
-        request_headers = headers or {}
-        if self.api_key and "X-API-Key" not in request_headers:
-            request_headers["X-API-Key"] = self.api_key
 
         last_exception = None
 
@@ -149,23 +211,22 @@ class APIClient:
                 # Make request
                 response = await client.request(
                     method=method,
-                    url=url,
+                    url=endpoint,
                     params=params,
                     json=json_data,
-                    headers=request_headers,
+                    headers=headers,
                 )
 
                 # Handle rate limit errors
                 if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        wait_time = int(retry_after)
-                    else:
-                        wait_time = (2 ** attempt) * self.retry_delay
+                    retry_after = response.headers.get("Retry-After", "")
+                    # Retry-After may also be an HTTP date; only seconds are honoured
+                    floor = float(retry_after) if retry_after.isdigit() else 0.0
+                    wait_time = self._backoff(attempt, floor)
 
                     if attempt < self.max_retries:
                         logger.warning(
-                            f"Rate limit exceeded. Retrying after {wait_time} seconds."
+                            f"Rate limit exceeded. Retrying after {wait_time:.2f} seconds."
                         )
                         await asyncio.sleep(wait_time)
                         continue
@@ -173,40 +234,22 @@ class APIClient:
                         raise RateLimitError(
                             "API rate limit exceeded",
                             status_code=429,
-                            response=response.json() if response.content else None,
+                            response=self._parse_error_body(response)[0],
                         )
 
                 # Handle other errors
                 if response.status_code >= 400:
-                    error_data = None
-                    error_message = None
-                    try:
-                        error_data = response.json()
-                        error_message = error_data.get('message', 'Unknown error')
-                    except Exception:
-                        # If response is HTML or plain text, extract a concise message
-                        response_text = response.text
-                        if response_text:
-                            # For HTML responses, try to extract title or use status code
-                            if response_text.strip().startswith('<!DOCTYPE') or response_text.strip().startswith('<html'):
-                                error_message = f"HTTP {response.status_code} - {response.reason_phrase}"
-                            else:
-                                # Truncate long text responses
-                                error_message = response_text[:500] if len(response_text) > 500 else response_text
-                        else:
-                            error_message = f"HTTP {response.status_code} - {response.reason_phrase}"
-                        error_data = {"message": error_message}
-
                     if attempt < self.max_retries and response.status_code >= 500:
                         # Retry on server errors
-                        wait_time = (2 ** attempt) * self.retry_delay
+                        wait_time = self._backoff(attempt)
                         logger.warning(
                             f"Server error {response.status_code}. "
-                            f"Retrying after {wait_time} seconds."
+                            f"Retrying after {wait_time:.2f} seconds."
                         )
                         await asyncio.sleep(wait_time)
                         continue
                     else:
+                        error_data, error_message = self._parse_error_body(response)
                         raise APIError(
                             f"API request failed: {error_message}",
                             status_code=response.status_code,
@@ -218,9 +261,9 @@ class APIClient:
             except (httpx.TimeoutException, httpx.ConnectError) as e:
                 last_exception = e
                 if attempt < self.max_retries:
-                    wait_time = (2 ** attempt) * self.retry_delay
+                    wait_time = self._backoff(attempt)
                     logger.warning(
-                        f"Connection error: {e}. Retrying after {wait_time} seconds."
+                        f"Connection error: {e}. Retrying after {wait_time:.2f} seconds."
                     )
                     await asyncio.sleep(wait_time)
                 else:
@@ -239,6 +282,9 @@ class APIClient:
     ) -> Dict[str, Any]:
         """Make GET request.
 
+        Responses carrying an ETag or Last-Modified header are remembered and
+        revalidated on the next identical request; a 304 reuses the stored body.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -247,8 +293,32 @@ class APIClient:
         Returns:
             JSON response as dictionary
         """
+        validator_key = f"GET {endpoint} {sorted(params.items()) if params else ''}"
+        validator = self._validators.get(validator_key)
+        if validator is not None:
+            etag, last_modified, _ = validator
+            headers = dict(headers) if headers else {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         response = await self._make_request("GET", endpoint, params=params, headers=headers)
-        return response.json()
+
+        if response.status_code == 304 and validator is not None:
+            # Unchanged since the last response: reuse its body
+            self._validators.move_to_end(validator_key)
+            return orjson.loads(validator[2])
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[validator_key] = (etag, last_modified, response.content)
+            self._validators.move_to_end(validator_key)
+            if len(self._validators) > self.VALIDATOR_CACHE_SIZE:
+                self._validators.popitem(last=False)
+
+        return orjson.loads(response.content)
 
     async def post(
         self,
@@ -271,7 +341,7 @@ class APIClient:
         response = await self._make_request(
             "POST", endpoint, json_data=json_data, params=params, headers=headers
         )
-        return response.json()
+        return orjson.loads(response.content)
 
     async def close(self):
         """Close HTTP client."""
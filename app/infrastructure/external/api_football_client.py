@@ -1,18 +1,50 @@
 """API-Football client for fetching sports data."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import logging
+import time
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
 
+from app.infrastructure.cache.cache_manager import cache_manager, CacheType
 from app.infrastructure.external.api_client import APIClient, APIError
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# (live, date, league_id, team_id) arguments of a fixtures lookup
+_FixturesKey = Tuple[bool, Optional[str], Optional[int], Optional[int]]
+
+
+@lru_cache(maxsize=1)
+def _utc_date_for_minute(minute: int) -> str:
+    """Format the UTC date (YYYY-MM-DD) of a minute since the epoch."""
+    return datetime.utcfromtimestamp(minute * 60).strftime("%Y-%m-%d")
+
+
+def _today_utc_str() -> str:
+    """Today's UTC date, formatted at most once a minute."""
+    return _utc_date_for_minute(int(time.time()) // 60)
+
 
 class APIFootballClient(APIClient):
     """Client for API-Football (https://www.api-football.com/)."""
 
+    CACHE_PREFIX = "v1:apifootball"
+    # Fixture TTLs: live scores change constantly, past days hardly ever
+    LIVE_FIXTURES_TTL = 30
+    TODAY_FIXTURES_TTL = 300
+    UPCOMING_FIXTURES_TTL = 3600
+    PAST_FIXTURES_TTL = 86400
+    # Per-process cache in front of Redis for repeated lookups within a worker
+    LOCAL_FIXTURES_CACHE_SIZE = 256
+    LOCAL_FIXTURES_TTL = 30
+    # Shared by every instance and keyed on the arguments only, so requests
+    # served by different clients hit the same entries
+    _local_fixtures: "OrderedDict[_FixturesKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize API-Football client.
 
@@ -29,14 +61,26 @@ class APIFootballClient(APIClient):
             max_retries=3,
             rate_limit_per_minute=10,  # Free tier: 10 requests/minute
         )
-        
-        # Store headers for API-Football (uses X-RapidAPI-Key)
-        self._api_football_headers = {}
-        if api_key:
-            self._api_football_headers = {
-                "X-RapidAPI-Key": api_key,
-                "X-RapidAPI-Host": "v3.football.api-sports.io",
-            }
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Add the API-Football (X-RapidAPI-*) headers to the client defaults."""
+        headers = super()._default_headers()
+        if self.api_key:
+            headers["X-RapidAPI-Key"] = self.api_key
+            headers["X-RapidAPI-Host"] = "v3.football.api-sports.io"
+        return headers
+
+    @classmethod
+    def _fixtures_ttl(cls, live: bool, date: Optional[str], today: str) -> int:
+        """Pick the cache TTL for a fixtures response."""
+        if live:
+            return cls.LIVE_FIXTURES_TTL
+        if date == today:
+            return cls.TODAY_FIXTURES_TTL
+        # ISO dates compare correctly as strings
+        if date < today:
+            return cls.PAST_FIXTURES_TTL
+        return cls.UPCOMING_FIXTURES_TTL
 
     async def get_fixtures(
         self,
@@ -47,6 +91,11 @@ class APIFootballClient(APIClient):
     ) -> Dict[str, Any]:
         """Get fixtures (matches) from API-Football.
 
+        Responses are cached per (date, league, team): for a few seconds in
+        process, then in Redis, with concurrent misses for the same key
+        collapsed into a single upstream request. Callers share the returned
+        dictionary and must not modify it.
+
         Args:
             live: If True, get only live fixtures
             date: Date filter (YYYY-MM-DD format)
@@ -56,7 +105,35 @@ class APIFootballClient(APIClient):
         Returns:
             API response dictionary
         """
+        key = (live, date, league_id, team_id)
+        cached = APIFootballClient._local_fixtures.get(key)
+        if cached is not None:
+            expires_at, response = cached
+            if time.monotonic() < expires_at:
+                APIFootballClient._local_fixtures.move_to_end(key)
+                return response
+            del APIFootballClient._local_fixtures[key]
+
+        response = await self._fetch_fixtures(live, date, league_id, team_id)
+        APIFootballClient._local_fixtures[key] = (
+            time.monotonic() + self.LOCAL_FIXTURES_TTL,
+            response,
+        )
+        APIFootballClient._local_fixtures.move_to_end(key)
+        while len(APIFootballClient._local_fixtures) > self.LOCAL_FIXTURES_CACHE_SIZE:
+            APIFootballClient._local_fixtures.popitem(last=False)
+        return response
+
+    async def _fetch_fixtures(
+        self,
+        live: bool,
+        date: Optional[str],
+        league_id: Optional[int],
+        team_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """Fetch fixtures through the Redis cache; see get_fixtures."""
         params = {}
+        today = _today_utc_str()
         
         if live:
             params["live"] = "all"
@@ -64,17 +141,65 @@ class APIFootballClient(APIClient):
             params["date"] = date
         else:
             # Default to today
-            params["date"] = datetime.utcnow().strftime("%Y-%m-%d")
+            params["date"] = today
         
         if league_id:
             params["league"] = league_id
         if team_id:
             params["team"] = team_id
 
+        cache_key = (
+            f"fixtures:{'live' if live else params['date']}"
+            f":{league_id or '-'}:{team_id or '-'}"
+        )
+        cached = await cache_manager.get(
+            CacheType.API_RESPONSE, cache_key, prefix=self.CACHE_PREFIX
+        )
+        if cached is not None:
+            return cached
+
         try:
-            response = await self.get("/fixtures", params=params, headers=self._api_football_headers)
-            return response
+            # Only one caller per key goes upstream; the rest find it cached
+            async with cache_manager.lock(
+                CacheType.API_RESPONSE, cache_key, prefix=self.CACHE_PREFIX
+            ):
+                cached = await cache_manager.get(
+                    CacheType.API_RESPONSE, cache_key, prefix=self.CACHE_PREFIX
+                )
+                if cached is not None:
+                    return cached
+
+                response = await self.get("/fixtures", params=params)
+                await cache_manager.set(
+                    CacheType.API_RESPONSE,
+                    cache_key,
+                    response,
+                    ttl=self._fixtures_ttl(live, params.get("date"), today),
+                    prefix=self.CACHE_PREFIX,
+                )
+                return response
         except APIError as e:
             logger.error(f"API-Football error: {e}")
             raise
 
+    async def get_fixtures_bulk(
+        self, specs: List[Tuple[Optional[int], Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Get fixtures for several (league_id, date) pairs concurrently.
+
+        All requests start at once; the client's rate limiter decides how many
+        actually go upstream at a time. If any request fails, the others are
+        cancelled and the error is raised.
+
+        Args:
+            specs: (league_id, date) pairs, as for get_fixtures
+
+        Returns:
+            API responses in the same order as specs
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self.get_fixtures(league_id=league_id, date=date))
+                for league_id, date in specs
+            ]
+        return [task.result() for task in tasks]
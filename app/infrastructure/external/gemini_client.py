@@ -1,93 +1,32 @@
 """Google Gemini AI client for comprehensive sports statistics analysis."""
 
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
+import asyncio
 import logging
-import json
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import orjson
+import xxhash
 
 from app.core.config import settings
 from app.infrastructure.cache.cache_service import cache_service
+from app.infrastructure.external.throttle import RequestPacer, jittered_backoff
 
 # Default cache TTL for Gemini responses (1 hour)
 DEFAULT_GEMINI_CACHE_TTL = getattr(settings, 'GEMINI_CACHE_TTL', 3600)
 
 logger = logging.getLogger(__name__)
 
+# Instructions shared by every match analysis prompt; the response structure
+# is MATCH_ANALYSIS_SCHEMA, sent as the response schema. It is kept
+# byte-identical and placed before the match details, so the model's prompt
+# (prefix) caching can reuse it across requests.
+ANALYSIS_PROMPT_PREFIX = """You are an expert sports analyst with deep knowledge of sports statistics and analytics.
+Analyze the match described at the end of this prompt.
 
-class GeminiClient:
-    """Client for Google Gemini AI sports analysis."""
-
-    def __init__(self):
-        """Initialize Gemini client."""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        # Use configured model or try available models in order of preference
-        # gemini-pro is deprecated, use gemini-1.5-flash, gemini-1.5-pro, or gemini-3-flash-preview
-        configured_model = getattr(settings, 'GEMINI_MODEL', None)
-        model_names = []
-        
-        if configured_model:
-            model_names = [configured_model]
-        
-        # Add fallback models if configured model fails
-        # Prioritize gemini-3-flash-preview, then gemini-1.5-flash, then gemini-1.5-pro
-        fallback_models = ['gemini-3-flash-preview', 'gemini-1.5-flash', 'gemini-1.5-pro']
-        for fallback in fallback_models:
-            if fallback not in model_names:
-                model_names.append(fallback)
-        
-        self.model = None
-        self.model_name = None
-        
-        for model_name in model_names:
-            try:
-                self.model = genai.GenerativeModel(model_name)
-                self.model_name = model_name
-                logger.info(f"Successfully initialized Gemini model: {model_name}")
-                break
-            except Exception as e:
-                logger.warning(f"Failed to initialize {model_name}: {e}")
-                continue
-        
-        if self.model is None:
-            raise ValueError("Failed to initialize any Gemini model. Please check your API key and available models.")
-        
-        self.timeout = 60
-
-    def _get_comprehensive_analysis_prompt(
-        self,
-        home_team: str,
-        away_team: str,
-        sport: str = "football",
-        league: Optional[str] = None,
-        match_date: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """Generate a comprehensive prompt for detailed sports statistics analysis.
-        
-        Args:
-            home_team: Home team name
-            away_team: Away team name
-            sport: Sport type (football, basketball, etc.)
-            league: League name (optional)
-            match_date: Match date (optional)
-            context: Additional context data (optional)
-        
-        Returns:
-            Detailed prompt string for Gemini
-        """
-        base_prompt = f"""You are an expert sports analyst with deep knowledge of {sport} statistics and analytics. 
-Analyze the upcoming match between {home_team} (home) and {away_team} (away).
-
-"""
-        
-        if league:
-            base_prompt += f"League: {league}\n"
-        if match_date:
-            base_prompt += f"Match Date: {match_date}\n"
-        
-        base_prompt += f"""
 Provide a COMPREHENSIVE and DETAILED statistical analysis in JSON format. Include ALL of the following:
 
 1. TEAM PERFORMANCE METRICS:
@@ -165,138 +104,7 @@ Provide a COMPREHENSIVE and DETAILED statistical analysis in JSON format. Includ
     - Recent poor form
     - Tactical vulnerabilities
 
-Return the analysis as a JSON object with the following structure:
-{{
-    "match_info": {{
-        "home_team": "{home_team}",
-        "away_team": "{away_team}",
-        "sport": "{sport}",
-        "league": "{league or 'Unknown'}",
-        "match_date": "{match_date or 'TBD'}"
-    }},
-    "team_performance": {{
-        "home": {{
-            "recent_form": {{"wins": 0, "draws": 0, "losses": 0, "goals_for": 0, "goals_against": 0}},
-            "home_record": {{"wins": 0, "draws": 0, "losses": 0, "win_rate": 0.0, "avg_goals_for": 0.0, "avg_goals_against": 0.0}},
-            "league_position": 0,
-            "points": 0,
-            "goals_scored": 0,
-            "goals_conceded": 0,
-            "clean_sheets": 0,
-            "avg_goals_per_match": 0.0,
-            "avg_goals_conceded_per_match": 0.0,
-            "shots_per_match": 0.0,
-            "shots_on_target_per_match": 0.0,
-            "possession_avg": 0.0,
-            "pass_accuracy_avg": 0.0,
-            "corners_per_match": 0.0,
-            "fouls_per_match": 0.0
-        }},
-        "away": {{
-            "recent_form": {{"wins": 0, "draws": 0, "losses": 0, "goals_for": 0, "goals_against": 0}},
-            "away_record": {{"wins": 0, "draws": 0, "losses": 0, "win_rate": 0.0, "avg_goals_for": 0.0, "avg_goals_against": 0.0}},
-            "league_position": 0,
-            "points": 0,
-            "goals_scored": 0,
-            "goals_conceded": 0,
-            "clean_sheets": 0,
-            "avg_goals_per_match": 0.0,
-            "avg_goals_conceded_per_match": 0.0,
-            "shots_per_match": 0.0,
-            "shots_on_target_per_match": 0.0,
-            "possession_avg": 0.0,
-            "pass_accuracy_avg": 0.0,
-            "corners_per_match": 0.0,
-            "fouls_per_match": 0.0
-        }}
-    }},
-    "head_to_head": {{
-        "total_meetings": 0,
-        "home_wins": 0,
-        "draws": 0,
-        "away_wins": 0,
-        "avg_goals_per_match": 0.0,
-        "recent_meetings": []
-    }},
-    "predictions": {{
-        "probabilities": {{
-            "home_win": 0.0,
-            "draw": 0.0,
-            "away_win": 0.0
-        }},
-        "expected_goals": {{
-            "home": 0.0,
-            "away": 0.0
-        }},
-        "likely_scorelines": [
-            {{"score": "0-0", "probability": 0.0}}
-        ],
-        "over_under": {{
-            "over_2_5": 0.0,
-            "under_2_5": 0.0
-        }},
-        "both_teams_to_score": 0.0,
-        "clean_sheet_home": 0.0,
-        "clean_sheet_away": 0.0
-    }},
-    "key_statistics": {{
-        "home": {{
-            "possession_avg": 0.0,
-            "shots_total_avg": 0.0,
-            "shots_on_target_avg": 0.0,
-            "passes_total_avg": 0.0,
-            "pass_accuracy_avg": 0.0,
-            "corners_avg": 0.0,
-            "fouls_avg": 0.0,
-            "yellow_cards_avg": 0.0,
-            "red_cards_avg": 0.0,
-            "offsides_avg": 0.0
-        }},
-        "away": {{
-            "possession_avg": 0.0,
-            "shots_total_avg": 0.0,
-            "shots_on_target_avg": 0.0,
-            "passes_total_avg": 0.0,
-            "pass_accuracy_avg": 0.0,
-            "corners_avg": 0.0,
-            "fouls_avg": 0.0,
-            "yellow_cards_avg": 0.0,
-            "red_cards_avg": 0.0,
-            "offsides_avg": 0.0
-        }}
-    }},
-    "advanced_metrics": {{
-        "home": {{
-            "expected_goals": 0.0,
-            "expected_goals_against": 0.0,
-            "expected_points": 0.0
-        }},
-        "away": {{
-            "expected_goals": 0.0,
-            "expected_goals_against": 0.0,
-            "expected_points": 0.0
-        }}
-    }},
-    "tactical_analysis": {{
-        "home": {{
-            "formation": "",
-            "playing_style": "",
-            "strengths": [],
-            "weaknesses": []
-        }},
-        "away": {{
-            "formation": "",
-            "playing_style": "",
-            "strengths": [],
-            "weaknesses": []
-        }}
-    }},
-    "risk_factors": {{
-        "home": [],
-        "away": []
-    }},
-    "analysis_summary": ""
-}}
+Return the analysis as JSON matching the provided response schema; match_info repeats the match details below.
 
 IMPORTANT: 
 - Provide realistic and detailed statistics based on your knowledge
@@ -306,11 +114,287 @@ IMPORTANT:
 - Be thorough and comprehensive in your analysis
 - Focus on actionable insights for match prediction and analysis
 """
+
+# Structured-output schemas (OpenAPI subset) for Gemini's JSON response mode
+_NUMBER = {"type": "number"}
+_INTEGER = {"type": "integer"}
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+
+def _object(**properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Object schema whose properties are all required."""
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+def _fields(schema: Dict[str, Any], *names: str) -> Dict[str, Dict[str, Any]]:
+    """Properties named ``names``, all sharing one schema."""
+    return {name: schema for name in names}
+
+
+_RECORD_SCHEMA = _object(
+    **_fields(_INTEGER, "wins", "draws", "losses"),
+    **_fields(_NUMBER, "win_rate", "avg_goals_for", "avg_goals_against"),
+)
+_TEAM_PERFORMANCE_FIELDS = {
+    "recent_form": _object(**_fields(_INTEGER, "wins", "draws", "losses", "goals_for", "goals_against")),
+    **_fields(_INTEGER, "league_position", "points", "goals_scored", "goals_conceded", "clean_sheets"),
+    **_fields(
+        _NUMBER,
+        "avg_goals_per_match",
+        "avg_goals_conceded_per_match",
+        "shots_per_match",
+        "shots_on_target_per_match",
+        "possession_avg",
+        "pass_accuracy_avg",
+        "corners_per_match",
+        "fouls_per_match",
+    ),
+}
+_KEY_STATISTICS_SCHEMA = _object(**_fields(
+    _NUMBER,
+    "possession_avg",
+    "shots_total_avg",
+    "shots_on_target_avg",
+    "passes_total_avg",
+    "pass_accuracy_avg",
+    "corners_avg",
+    "fouls_avg",
+    "yellow_cards_avg",
+    "red_cards_avg",
+    "offsides_avg",
+))
+_ADVANCED_METRICS_SCHEMA = _object(
+    **_fields(_NUMBER, "expected_goals", "expected_goals_against", "expected_points"),
+)
+_TACTICAL_SCHEMA = _object(
+    formation=_STRING,
+    playing_style=_STRING,
+    strengths=_STRING_LIST,
+    weaknesses=_STRING_LIST,
+)
+
+MATCH_ANALYSIS_SCHEMA = _object(
+    match_info=_object(**_fields(_STRING, "home_team", "away_team", "sport", "league", "match_date")),
+    team_performance=_object(
+        home=_object(home_record=_RECORD_SCHEMA, **_TEAM_PERFORMANCE_FIELDS),
+        away=_object(away_record=_RECORD_SCHEMA, **_TEAM_PERFORMANCE_FIELDS),
+    ),
+    head_to_head=_object(
+        **_fields(_INTEGER, "total_meetings", "home_wins", "draws", "away_wins"),
+        avg_goals_per_match=_NUMBER,
+        recent_meetings=_STRING_LIST,
+    ),
+    predictions=_object(
+        probabilities=_object(**_fields(_NUMBER, "home_win", "draw", "away_win")),
+        expected_goals=_object(**_fields(_NUMBER, "home", "away")),
+        likely_scorelines={"type": "array", "items": _object(score=_STRING, probability=_NUMBER)},
+        over_under=_object(**_fields(_NUMBER, "over_2_5", "under_2_5")),
+        **_fields(_NUMBER, "both_teams_to_score", "clean_sheet_home", "clean_sheet_away"),
+    ),
+    key_statistics=_object(home=_KEY_STATISTICS_SCHEMA, away=_KEY_STATISTICS_SCHEMA),
+    advanced_metrics=_object(home=_ADVANCED_METRICS_SCHEMA, away=_ADVANCED_METRICS_SCHEMA),
+    tactical_analysis=_object(home=_TACTICAL_SCHEMA, away=_TACTICAL_SCHEMA),
+    risk_factors=_object(home=_STRING_LIST, away=_STRING_LIST),
+    analysis_summary=_STRING,
+)
+
+
+# Match-specific tail appended to ANALYSIS_PROMPT_PREFIX
+MATCH_DETAILS_TEMPLATE = """
+Match to analyze:
+Sport: {sport}
+Home team: {home_team}
+Away team: {away_team}
+"""
+
+TEAM_STATISTICS_PROMPT_TEMPLATE = """You are an expert sports analyst. Provide comprehensive statistics for {team_name} in {sport}.
+
+Include:
+1. Current season performance (wins, draws, losses, goals for/against, points, position)
+2. Recent form (last 5-10 matches)
+3. Home and away records
+4. Key players and their statistics
+5. Tactical style and formation
+6. Strengths and weaknesses
+7. Average statistics per match (goals, shots, possession, passes, etc.)
+8. Historical performance trends
+
+Return as JSON with detailed statistics."""
+
+
+class GeminiClient:
+    """Client for Google Gemini AI sports analysis."""
+
+    # Responses come back as bare JSON, so no fences or prose to strip
+    ANALYSIS_GENERATION_CONFIG = {
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "top_k": 40,
+        "max_output_tokens": 8192,
+        "response_mime_type": "application/json",
+        "response_schema": MATCH_ANALYSIS_SCHEMA,
+    }
+    TEAM_STATISTICS_GENERATION_CONFIG = {
+        "temperature": 0.7,
+        "max_output_tokens": 4096,
+        "response_mime_type": "application/json",
+    }
+
+    # Analysis cache TTLs by match status (from the context's "status")
+    LIVE_ANALYSIS_TTL = 900
+    FINISHED_ANALYSIS_TTL = 86400
+    LIVE_STATUSES = frozenset({"live", "inprogress", "1h", "2h", "ht", "et"})
+    FINISHED_STATUSES = frozenset({"finished", "ft", "aet", "pen", "ended"})
+
+    # Transient API errors (quota, overload, timeouts) are retried with jitter
+    MAX_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 0.25
+    MAX_RETRY_DELAY = 4.0
+    RETRYABLE_ERRORS = (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.InternalServerError,
+        google_exceptions.DeadlineExceeded,
+    )
+    _pacer = RequestPacer(settings.GEMINI_REQUESTS_PER_SECOND)
+
+    def __init__(self):
+        """Initialize Gemini client."""
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        # Use configured model or try available models in order of preference
+        # gemini-pro is deprecated, use gemini-1.5-flash, gemini-1.5-pro, or gemini-3-flash-preview
+        configured_model = getattr(settings, 'GEMINI_MODEL', None)
+        model_names = []
         
-        if context:
-            base_prompt += f"\n\nAdditional Context:\n{json.dumps(context, indent=2)}\n"
+        if configured_model:
+            model_names = [configured_model]
+        
+        # Add fallback models if configured model fails
+        # Prioritize gemini-3-flash-preview, then gemini-1.5-flash, then gemini-1.5-pro
+        fallback_models = ['gemini-3-flash-preview', 'gemini-1.5-flash', 'gemini-1.5-pro']
+        for fallback in fallback_models:
+            if fallback not in model_names:
+                model_names.append(fallback)
+        
+        self.model = None
+        self.model_name = None
+        
+        for model_name in model_names:
+            try:
+                self.model = genai.GenerativeModel(model_name)
+                self.model_name = model_name
+                logger.info("Successfully initialized Gemini model: %s", model_name)
+                break
+            except Exception as e:
+                logger.warning("Failed to initialize %s: %s", model_name, e)
+                continue
+        
+        if self.model is None:
+            raise ValueError("Failed to initialize any Gemini model. Please check your API key and available models.")
         
-        return base_prompt
+        self.timeout = 60
+        # Bounds in-flight Gemini requests to stay within the API rate limits
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+
+    async def _generate(self, prompt: str, generation_config: Dict[str, Any], stream: bool = False) -> Any:
+        """Call generate_content_async, paced and retried on transient errors."""
+        for attempt in range(self.MAX_ATTEMPTS):
+            await self._pacer.wait()
+            try:
+                return await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    stream=stream,
+                )
+            except self.RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                wait_time = jittered_backoff(attempt, self.RETRY_BASE_DELAY, self.MAX_RETRY_DELAY)
+                logger.warning("Gemini request failed (%s), retrying in %.2fs", e, wait_time)
+                await asyncio.sleep(wait_time)
+
+    def _get_comprehensive_analysis_prompt(
+        self,
+        home_team: str,
+        away_team: str,
+        sport: str = "football",
+        league: Optional[str] = None,
+        match_date: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Generate a comprehensive prompt for detailed sports statistics analysis.
+        
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            sport: Sport type (football, basketball, etc.)
+            league: League name (optional)
+            match_date: Match date (optional)
+            context: Additional context data (optional)
+        
+        Returns:
+            Detailed prompt string for Gemini
+        """
+        # Static instructions first, match-specific details last; joined
+        # once so the large prefix is copied a single time
+        parts = [
+            ANALYSIS_PROMPT_PREFIX,
+            MATCH_DETAILS_TEMPLATE.format(sport=sport, home_team=home_team, away_team=away_team),
+        ]
+        if league:
+            parts.append(f"League: {league}\n")
+        if match_date:
+            parts.append(f"Match Date: {match_date}\n")
+        if context:
+            parts.append(
+                "\nAdditional Context:\n"
+                f"{orjson.dumps(context, option=orjson.OPT_INDENT_2, default=str).decode()}\n"
+            )
+
+        return "".join(parts)
+
+    @staticmethod
+    def _normalize_name(value: str) -> str:
+        """Normalize a name for cache keys (case and whitespace)."""
+        return " ".join(value.lower().split())
+
+    @classmethod
+    def _analysis_cache_params(
+        cls,
+        home_team: str,
+        away_team: str,
+        sport: str,
+        league: Optional[str],
+        match_date: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the cache parameters identifying a match analysis request."""
+        cache_params = {
+            "home_team": cls._normalize_name(home_team),
+            "away_team": cls._normalize_name(away_team),
+            "sport": cls._normalize_name(sport),
+        }
+        if league:
+            cache_params["league"] = cls._normalize_name(league)
+        if match_date:
+            cache_params["match_date"] = match_date.strip()
+        if context:
+            # The context is part of the prompt, so it must be part of the key
+            cache_params["context"] = xxhash.xxh3_64_hexdigest(
+                orjson.dumps(context, option=orjson.OPT_SORT_KEYS, default=str)
+            )
+        return cache_params
+
+    @classmethod
+    def _analysis_ttl(cls, context: Optional[Dict[str, Any]], cache_ttl: int) -> int:
+        """Pick the analysis cache TTL, shorter for live and longer for finished matches."""
+        status = str((context or {}).get("status", "")).lower()
+        if status in cls.LIVE_STATUSES:
+            return min(cache_ttl, cls.LIVE_ANALYSIS_TTL)
+        if status in cls.FINISHED_STATUSES:
+            return max(cache_ttl, cls.FINISHED_ANALYSIS_TTL)
+        return cache_ttl
 
     async def analyze_match(
         self,
@@ -333,26 +417,21 @@ IMPORTANT:
             match_date: Match date (optional)
             context: Additional context data (optional)
             use_cache: Whether to use cache (default: True)
-            cache_ttl: Cache TTL in seconds (default: 3600 = 1 hour)
+            cache_ttl: Cache TTL in seconds (default: 3600 = 1 hour); capped
+                for live matches and extended for finished ones
         
         Returns:
             Dictionary with comprehensive match analysis
         """
+        cache_params = self._analysis_cache_params(
+            home_team, away_team, sport, league, match_date, context
+        )
+
         # Check cache first
         if use_cache:
-            cache_params = {
-                "home_team": home_team.lower().strip(),
-                "away_team": away_team.lower().strip(),
-                "sport": sport.lower().strip(),
-            }
-            if league:
-                cache_params["league"] = league.lower().strip()
-            if match_date:
-                cache_params["match_date"] = match_date.strip()
-            
             cached_analysis = await cache_service.get("gemini_analysis", cache_params)
             if cached_analysis:
-                logger.info(f"Returning cached Gemini analysis for {home_team} vs {away_team}")
+                logger.info("Returning cached Gemini analysis for %s vs %s", home_team, away_team)
                 return cached_analysis
         
         try:
@@ -365,82 +444,175 @@ IMPORTANT:
                 context=context
             )
             
-            logger.info(f"Requesting Gemini analysis for {home_team} vs {away_team}")
+            logger.info("Requesting Gemini analysis for %s vs %s", home_team, away_team)
             
-            # Generate response
-            response = self.model.generate_content(
-                prompt,
-                generation_config={
-                    "temperature": 0.7,
-                    "top_p": 0.95,
-                    "top_k": 40,
-                    "max_output_tokens": 8192,
-                }
+            # Generate response (async API, so the event loop isn't blocked)
+            async with self._semaphore:
+                response = await self._generate(prompt, self.ANALYSIS_GENERATION_CONFIG)
+
+            return await self._finish_analysis(
+                response.text,
+                home_team=home_team,
+                away_team=away_team,
+                sport=sport,
+                league=league,
+                context=context,
+                cache_params=cache_params if use_cache else None,
+                cache_ttl=cache_ttl,
             )
             
-            # Extract JSON from response
-            response_text = response.text.strip()
-            
-            # Try to extract JSON if response includes markdown code blocks
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                if json_end > json_start:
-                    response_text = response_text[json_start:json_end].strip()
-            
-            # Parse JSON response
-            try:
-                analysis_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse Gemini JSON response: {e}")
-                logger.debug(f"Response text: {response_text[:500]}")
-                # Return a structured error response
-                return {
-                    "error": "Failed to parse analysis response",
-                    "raw_response": response_text[:1000],
-                    "match_info": {
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "sport": sport,
-                        "league": league or "Unknown",
-                    }
-                }
-            
-            # Add metadata
-            analysis_data["generated_at"] = datetime.utcnow().isoformat()
-            analysis_data["source"] = "gemini_ai"
-            
-            # Cache the response
-            if use_cache:
-                cache_params = {
-                    "home_team": home_team.lower().strip(),
-                    "away_team": away_team.lower().strip(),
-                    "sport": sport.lower().strip(),
-                }
-                if league:
-                    cache_params["league"] = league.lower().strip()
-                if match_date:
-                    cache_params["match_date"] = match_date.strip()
-                
-                await cache_service.set(
-                    "gemini_analysis",
-                    analysis_data,
-                    params=cache_params,
-                    ttl_seconds=cache_ttl,
-                )
-                logger.info(f"Cached Gemini analysis for {home_team} vs {away_team} (TTL: {cache_ttl}s)")
-            
-            logger.info(f"Successfully generated analysis for {home_team} vs {away_team}")
-            return analysis_data
-            
         except Exception as e:
-            logger.error(f"Error generating Gemini analysis: {e}", exc_info=True)
+            logger.error("Error generating Gemini analysis: %s", e, exc_info=True)
             raise
 
+    async def _finish_analysis(
+        self,
+        response_text: str,
+        home_team: str,
+        away_team: str,
+        sport: str,
+        league: Optional[str],
+        context: Optional[Dict[str, Any]],
+        cache_params: Optional[Dict[str, Any]],
+        cache_ttl: int,
+    ) -> Dict[str, Any]:
+        """Parse a Gemini analysis response, add metadata and cache it.
+
+        Args:
+            response_text: Full text returned by Gemini
+            home_team: Home team name
+            away_team: Away team name
+            sport: Sport type
+            league: League name (optional)
+            context: Additional context data (optional)
+            cache_params: Cache parameters, or None to skip caching
+            cache_ttl: Cache TTL in seconds
+
+        Returns:
+            Dictionary with the match analysis, or a structured error
+        """
+        # Parse the JSON response (only a truncated response fails here)
+        try:
+            analysis_data = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse Gemini JSON response: %s", e)
+            logger.debug("Response text: %.500s", response_text)
+            # Return a structured error response
+            return {
+                "error": "Failed to parse analysis response",
+                "raw_response": response_text[:1000],
+                "match_info": {
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "sport": sport,
+                    "league": league or "Unknown",
+                }
+            }
+        
+        # Add metadata
+        analysis_data["generated_at"] = datetime.utcnow().isoformat()
+        analysis_data["source"] = "gemini_ai"
+        
+        # Cache the response
+        if cache_params is not None:
+            cache_ttl = self._analysis_ttl(context, cache_ttl)
+            await cache_service.set(
+                "gemini_analysis",
+                analysis_data,
+                params=cache_params,
+                ttl_seconds=cache_ttl,
+            )
+            logger.info("Cached Gemini analysis for %s vs %s (TTL: %ss)", home_team, away_team, cache_ttl)
+        
+        logger.info("Successfully generated analysis for %s vs %s", home_team, away_team)
+        return analysis_data
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Text of a streamed chunk, or "" for chunks without text parts."""
+        try:
+            return chunk.text
+        except ValueError:
+            return ""
+
+    @staticmethod
+    def _sse_event(event: str, data: Any) -> bytes:
+        """Format one server-sent event."""
+        return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+    async def analyze_match_stream(
+        self,
+        home_team: str,
+        away_team: str,
+        sport: str = "football",
+        league: Optional[str] = None,
+        match_date: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        cache_ttl: int = DEFAULT_GEMINI_CACHE_TTL,
+    ) -> AsyncIterator[bytes]:
+        """Stream a match analysis as server-sent events.
+
+        Text is forwarded as "chunk" events while Gemini generates it,
+        followed by one "analysis" event with the parsed result (as returned
+        by analyze_match). Cached analyses are sent as the "analysis" event
+        straight away. If generation fails, an "error" event ends the stream.
+
+        Args:
+            Same as analyze_match
+
+        Yields:
+            Encoded server-sent events
+        """
+        cache_params = self._analysis_cache_params(
+            home_team, away_team, sport, league, match_date, context
+        )
+
+        if use_cache:
+            cached_analysis = await cache_service.get("gemini_analysis", cache_params)
+            if cached_analysis:
+                logger.info("Returning cached Gemini analysis for %s vs %s", home_team, away_team)
+                yield self._sse_event("analysis", cached_analysis)
+                return
+
+        prompt = self._get_comprehensive_analysis_prompt(
+            home_team=home_team,
+            away_team=away_team,
+            sport=sport,
+            league=league,
+            match_date=match_date,
+            context=context
+        )
+
+        logger.info("Streaming Gemini analysis for %s vs %s", home_team, away_team)
+
+        parts: List[str] = []
+        try:
+            # The slot only covers opening the stream; the client may read slowly
+            async with self._semaphore:
+                response = await self._generate(prompt, self.ANALYSIS_GENERATION_CONFIG, stream=True)
+            async for chunk in response:
+                text = self._chunk_text(chunk)
+                if text:
+                    parts.append(text)
+                    yield self._sse_event("chunk", {"text": text})
+
+            analysis_data = await self._finish_analysis(
+                "".join(parts),
+                home_team=home_team,
+                away_team=away_team,
+                sport=sport,
+                league=league,
+                context=context,
+                cache_params=cache_params if use_cache else None,
+                cache_ttl=cache_ttl,
+            )
+        except Exception as e:
+            logger.error("Error streaming Gemini analysis: %s", e, exc_info=True)
+            yield self._sse_event("error", {"detail": f"Failed to generate analysis: {e}"})
+            return
+        yield self._sse_event("analysis", analysis_data)
+
     async def get_team_statistics(
         self,
         team_name: str,
@@ -472,42 +644,19 @@ IMPORTANT:
             
             cached_stats = await cache_service.get("gemini_team_stats", cache_params)
             if cached_stats:
-                logger.info(f"Returning cached team statistics for {team_name}")
+                logger.info("Returning cached team statistics for %s", team_name)
                 return cached_stats
         
-        prompt = f"""You are an expert sports analyst. Provide comprehensive statistics for {team_name} in {sport}.
-
-Include:
-1. Current season performance (wins, draws, losses, goals for/against, points, position)
-2. Recent form (last 5-10 matches)
-3. Home and away records
-4. Key players and their statistics
-5. Tactical style and formation
-6. Strengths and weaknesses
-7. Average statistics per match (goals, shots, possession, passes, etc.)
-8. Historical performance trends
-
-Return as JSON with detailed statistics."""
+        prompt = TEAM_STATISTICS_PROMPT_TEMPLATE.format(team_name=team_name, sport=sport)
         
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config={
-                    "temperature": 0.7,
-                    "max_output_tokens": 4096,
-                }
-            )
-            
-            response_text = response.text.strip()
-            
-            # Extract JSON
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
+            async with self._semaphore:
+                response = await self._generate(prompt, self.TEAM_STATISTICS_GENERATION_CONFIG)
             
+            response_text = response.text
+
             try:
-                stats = json.loads(response_text)
+                stats = orjson.loads(response_text)
                 stats["generated_at"] = datetime.utcnow().isoformat()
                 stats["source"] = "gemini_ai"
                 
@@ -526,10 +675,10 @@ Return as JSON with detailed statistics."""
                         params=cache_params,
                         ttl_seconds=cache_ttl,
                     )
-                    logger.info(f"Cached team statistics for {team_name} (TTL: {cache_ttl}s)")
+                    logger.info("Cached team statistics for %s (TTL: %ss)", team_name, cache_ttl)
                 
                 return stats
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {
                     "error": "Failed to parse response",
                     "raw_response": response_text[:500],
@@ -537,7 +686,7 @@ Return as JSON with detailed statistics."""
                 }
                 
         except Exception as e:
-            logger.error(f"Error getting team statistics: {e}", exc_info=True)
+            logger.error("Error getting team statistics: %s", e, exc_info=True)
             raise
 
     async def analyze_match_with_context(
@@ -567,3 +716,32 @@ Return as JSON with detailed statistics."""
             context=match_data
         )
 
+    async def analyze_matches(
+        self,
+        matches: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """Analyze several matches concurrently.
+
+        Each match is analyzed as by analyze_match_with_context; the number of
+        Gemini requests in flight is capped by GEMINI_MAX_CONCURRENCY.
+
+        Args:
+            matches: List of match information dictionaries
+
+        Returns:
+            Analyses in the same order as matches; a failed analysis is
+            returned as its exception instead
+        """
+        return await asyncio.gather(
+            *(self.analyze_match_with_context(match_data) for match_data in matches),
+            return_exceptions=True,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_gemini_client() -> GeminiClient:
+    """Get the shared Gemini client, configuring the SDK on first use.
+
+    Its semaphore then bounds concurrent Gemini requests across all callers.
+    """
+    return GeminiClient()
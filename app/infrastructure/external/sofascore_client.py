@@ -1,45 +1,236 @@
 """SofaScore web scraper client for match data and statistics."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-import logging
-import re
+import asyncio
 import json
-from urllib.parse import urlparse, parse_qs
+import logging
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from urllib.parse import urlparse, parse_qs, quote
 
 import httpx
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
 from app.core.config import settings
+from app.infrastructure.external.throttle import RequestPacer, jittered_backoff
 
 logger = logging.getLogger(__name__)
 
+# Browser-like request headers, shared read-only by every client instance
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Upgrade-Insecure-Requests": "1",
+})
+
+# libxml2-backed tree builder; several times faster than 'html.parser', which
+# remains the fallback where lxml is not installed
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+
+def _fragment_match_id(fragment: str) -> Optional[int]:
+    """Read the match ID from a URL fragment such as ``id:15389642``."""
+    start = fragment.find('id:')
+    while start != -1:
+        start += 3
+        end = start
+        while end < len(fragment) and fragment[end].isdecimal():
+            end += 1
+        if end > start:
+            return int(fragment[start:end])
+        start = fragment.find('id:', start)
+    return None
+
+
+def _url_path(url: str) -> str:
+    """Path of a URL without its query string or fragment."""
+    url = url.partition('#')[0].partition('?')[0]
+    scheme_end = url.find('://')
+    if scheme_end == -1:
+        # Not an absolute URL; let urllib work out what it is
+        return urlparse(url).path
+    path_start = url.find('/', scheme_end + 3)
+    return url[path_start:] if path_start != -1 else ''
+
+
+def _parse_score_text(text: str) -> Optional[Tuple[int, int]]:
+    """Read a score such as ``2-1`` or ``2:1``."""
+    separator = text.find(':')
+    if separator == -1:
+        separator = text.find('-')
+    home_score, away_score = text[:separator], text[separator + 1:]
+    if separator > 0 and home_score.isdecimal() and away_score.isdecimal():
+        return int(home_score), int(away_score)
+    return None
+
+
+# Clickable items in the search dropdown (could be buttons, links, or divs),
+# as one selector list so the browser matches them in a single query
+_DROPDOWN_RESULT_SELECTOR = ", ".join([
+    '.z_dropdown button',
+    '.z_dropdown a',
+    '.z_dropdown [role="button"]',
+    '.z_dropdown div[class*="result"]',
+    '.z_dropdown div[class*="item"]',
+])
+
+# Any element of the dropdown's last resort selector counts as a result
+_DROPDOWN_FALLBACK_SELECTOR = '.z_dropdown > * > *'
+
+# True once the dropdown holds at least one result
+_DROPDOWN_POPULATED_SCRIPT = """
+    ([selector, fallbackSelector]) =>
+        document.querySelector(selector) !== null || document.querySelector(fallbackSelector) !== null
+"""
+
+# Text content, href and data-* attributes of a dropdown result
+_RESULT_INFO_SCRIPT = """
+    (element) => {
+        const data = {};
+        for (const attr of element.attributes) {
+            if (attr.name.startsWith('data-')) {
+                data[attr.name] = attr.value;
+            }
+        }
+        return {text: element.textContent, href: element.getAttribute('href'), data};
+    }
+"""
+
+# Inline page state; raw_decode parses the object after it and stops at its
+# closing brace (orjson has no equivalent)
+_INITIAL_STATE_ANCHOR = "window.__INITIAL_STATE__"
+_JSON_DECODER = json.JSONDecoder()
+
+# type attribute value of JSON-LD script tags
+_JSON_LD_TYPE = "application/ld+json"
+
+# Class substrings marking the elements _parse_html_structure reads
+_MATCH_CLASS_KEYWORDS = frozenset({'team', 'participant', 'score'})
+
+
+def _is_match_element_class(value: Optional[str]) -> bool:
+    """Whether a class value names a team, participant or score element."""
+    if not value:
+        return False
+    value = value.lower()
+    return any(keyword in value for keyword in _MATCH_CLASS_KEYWORDS)
+
+
+# Only these elements are built into a tree; the rest of the page is skipped
+_SCRIPT_STRAINER = SoupStrainer('script')
+_MATCH_ELEMENT_STRAINER = SoupStrainer(['span', 'div'], class_=_is_match_element_class)
+
 
 class SofaScoreClient:
     """Client for scraping SofaScore match data."""
 
+    # HTTP connection pool, shared by every instance and closed at shutdown
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    _http_client: Optional[httpx.AsyncClient] = None
+
+    # Transient failures (connection errors, 429, 5xx) are retried with jitter
+    MAX_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 0.25
+    MAX_RETRY_DELAY = 4.0
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    _pacer = RequestPacer(settings.SOFASCORE_REQUESTS_PER_SECOND)
+
+    # Upper bound (ms) on waiting for a selected search result to navigate
+    SELECTION_NAVIGATION_TIMEOUT = 2000
+
+    # Team name -> SofaScore team ID; IDs never change, so entries live a day
+    TEAM_ID_CACHE_SIZE = 512
+    TEAM_ID_TTL = 86400
+    _team_ids: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+
     def __init__(self):
         """Initialize SofaScore client."""
         self.base_url = "https://www.sofascore.com"
         self.timeout = 30
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        self.headers = _DEFAULT_HEADERS
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get HTTP client."""
-        return httpx.AsyncClient(
-            timeout=self.timeout,
-            headers=self.headers,
-            follow_redirects=True,
-        )
+        """Get the shared HTTP client, creating it on first use.
+
+        Connections are kept alive (and multiplexed over HTTP/2) across
+        requests and client instances instead of reconnecting each call.
+        """
+        client = SofaScoreClient._http_client
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                http2=True,
+            )
+            SofaScoreClient._http_client = client
+        return client
+
+    async def warm_up(self):
+        """Open a connection to SofaScore ahead of the first request.
+
+        DNS resolution and the TLS handshake then happen at startup rather
+        than on a user request; the connection stays in the shared pool.
+        """
+        client = await self._get_client()
+        try:
+            await client.head(self.base_url)
+        except httpx.HTTPError as e:
+            logger.warning("SofaScore warm-up failed: %s", e)
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared HTTP client."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET through the shared client, paced and retried on transient failures.
+
+        The last response is returned as-is once retries run out, so callers
+        keep handling status codes themselves.
+        """
+        client = await self._get_client()
+        for attempt in range(self.MAX_ATTEMPTS):
+            last_attempt = attempt == self.MAX_ATTEMPTS - 1
+            await self._pacer.wait()
+            try:
+                response = await client.get(url, **kwargs)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                wait_time = jittered_backoff(attempt, self.RETRY_BASE_DELAY, self.MAX_RETRY_DELAY)
+                logger.warning("SofaScore request failed (%s), retrying in %.2fs", e, wait_time)
+                await asyncio.sleep(wait_time)
+                continue
+
+            if response.status_code not in self.RETRY_STATUS_CODES or last_attempt:
+                return response
+
+            retry_after = response.headers.get("Retry-After", "")
+            # Retry-After may also be an HTTP date; only seconds are honoured
+            floor = float(retry_after) if retry_after.isdigit() else 0.0
+            wait_time = max(floor, jittered_backoff(attempt, self.RETRY_BASE_DELAY, self.MAX_RETRY_DELAY))
+            logger.warning("SofaScore returned %s, retrying in %.2fs", response.status_code, wait_time)
+            await asyncio.sleep(wait_time)
 
     async def get_match_data(self, match_url: str) -> Dict[str, Any]:
         """Scrape match data from SofaScore URL.
@@ -51,63 +242,90 @@ class SofaScoreClient:
             Dictionary with match data, statistics, and historical data
         """
         try:
-            async with await self._get_client() as client:
-                response = await client.get(match_url)
-                response.raise_for_status()
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Try to extract JSON data from script tags (SofaScore often embeds data in JS)
-                match_data = self._extract_json_data(soup, response.text)
-                
-                if not match_data:
-                    # Fallback: parse HTML structure
-                    match_data = self._parse_html_structure(soup, match_url)
-                
-                return match_data
-                
+            response = await self._get(match_url)
+            response.raise_for_status()
+            
+            html = response.text
+            
+            # Try to extract JSON data from script tags (SofaScore often embeds data in JS)
+            match_data = self._extract_json_data(html)
+            
+            if not match_data:
+                # Fallback: parse HTML structure
+                match_data = self._parse_html_structure(html, match_url)
+            
+            return match_data
+            
         except Exception as e:
             logger.error(f"Error scraping SofaScore match {match_url}: {e}", exc_info=True)
             raise
 
-    def _extract_json_data(self, soup: BeautifulSoup, html_text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON data embedded in script tags."""
-        # Look for JSON-LD structured data
-        json_ld = soup.find_all('script', type='application/ld+json')
-        for script in json_ld:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'SportsEvent':
-                    return self._parse_json_ld(data)
-            except:
+    def _extract_json_data(self, html_text: str) -> Optional[Dict[str, Any]]:
+        """Extract JSON data embedded in script tags.
+
+        The raw HTML is searched for the inline page state and JSON-LD
+        blocks first; a tree of script tags is only built when neither is
+        found. A JSON-LD SportsEvent wins over any other object with an id
+        and a name.
+        """
+        # Look for window.__INITIAL_STATE__ in the raw HTML
+        anchor = html_text.find(_INITIAL_STATE_ANCHOR)
+        if anchor != -1:
+            start = html_text.find('{', anchor + len(_INITIAL_STATE_ANCHOR))
+            if start != -1:
+                try:
+                    data, _ = _JSON_DECODER.raw_decode(html_text, start)
+                    state = self._parse_initial_state(data)
+                except:
+                    state = None
+                # A state without an event is empty; fall through to JSON-LD
+                if state:
+                    return state
+
+        # Look for JSON-LD structured data in the raw HTML
+        json_ld = self._find_json_ld_event(html_text)
+        if json_ld is not None:
+            return self._parse_json_ld(json_ld)
+
+        # Look for any JSON object with an id and a name
+        fallback = None
+        scripts = BeautifulSoup(html_text, _HTML_PARSER, parse_only=_SCRIPT_STRAINER).find_all('script')
+        for script in scripts:
+            text = script.get_text().strip()
+            if not text.startswith('{'):
                 continue
-        
-        # Look for window.__INITIAL_STATE__ or similar
-        pattern = r'window\.__INITIAL_STATE__\s*=\s*({.+?});'
-        match = re.search(pattern, html_text, re.DOTALL)
-        if match:
             try:
-                data = json.loads(match.group(1))
-                return self._parse_initial_state(data)
-            except:
-                pass
-        
-        # Look for any JSON data in script tags
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string and ('match' in script.string.lower() or 'event' in script.string.lower()):
-                # Try to extract JSON objects
-                json_pattern = r'\{[^{}]*"id"[^{}]*"name"[^{}]*\}'
-                matches = re.findall(json_pattern, script.string)
-                for match_str in matches:
-                    try:
-                        data = json.loads(match_str)
-                        if 'id' in data and 'name' in data:
-                            return data
-                    except:
-                        continue
-        
+                data = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                continue
+            if data.get('@type') == 'SportsEvent':
+                return self._parse_json_ld(data)
+            if fallback is None and 'id' in data and 'name' in data:
+                fallback = data
+
+        return fallback
+
+    @staticmethod
+    def _find_json_ld_event(html_text: str) -> Optional[Dict[str, Any]]:
+        """Find a JSON-LD SportsEvent by scanning the raw HTML for its script tags."""
+        position = html_text.find('<script')
+        while position != -1:
+            tag_end = html_text.find('>', position)
+            if tag_end == -1:
+                break
+            body_end = html_text.find('</script>', tag_end)
+            if body_end == -1:
+                break
+            # Only the opening tag is checked, so the type named in other
+            # scripts' code is not mistaken for a JSON-LD block
+            if _JSON_LD_TYPE in html_text[position:tag_end]:
+                try:
+                    data = orjson.loads(html_text[tag_end + 1:body_end].strip())
+                except orjson.JSONDecodeError:
+                    data = None
+                if isinstance(data, dict) and data.get('@type') == 'SportsEvent':
+                    return data
+            position = html_text.find('<script', body_end)
         return None
 
     def _parse_json_ld(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -136,41 +354,49 @@ class SofaScoreClient:
             }
         return {}
 
-    def _parse_html_structure(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
-        """Parse HTML structure as fallback."""
+    def _parse_html_structure(self, html_text: str, url: str) -> Dict[str, Any]:
+        """Parse HTML structure as fallback.
+
+        Only team, participant and score elements are built into the tree.
+        """
+        soup = BeautifulSoup(html_text, _HTML_PARSER, parse_only=_MATCH_ELEMENT_STRAINER)
         result = {
             "url": url,
             "scraped_at": datetime.utcnow().isoformat(),
         }
         
         # Extract match ID from URL
-        match_id_match = re.search(r'#id:(\d+)', url)
-        if match_id_match:
-            result["match_id"] = int(match_id_match.group(1))
+        match_id = _fragment_match_id(url.partition('#')[2])
+        if match_id is not None:
+            result["match_id"] = match_id
         
-        # Try to find team names
-        team_elements = soup.find_all(['span', 'div'], class_=re.compile(r'team|participant', re.I))
+        # Find team names and the score in one pass over the matching elements
+        team_elements_seen = 0
         teams = []
-        for elem in team_elements[:4]:  # Limit to first 4 matches
-            text = elem.get_text(strip=True)
-            if text and len(text) > 2 and len(text) < 50:
-                teams.append(text)
+        score: Optional[Tuple[int, int]] = None
+        for elem in soup.find_all(['span', 'div'], class_=_is_match_element_class):
+            classes = " ".join(elem.get('class', [])).lower()
+            
+            if team_elements_seen < 4 and ('team' in classes or 'participant' in classes):
+                # Limit to first 4 matches
+                team_elements_seen += 1
+                text = elem.get_text(strip=True)
+                if text and len(text) > 2 and len(text) < 50:
+                    teams.append(text)
+            
+            if score is None and 'score' in classes:
+                score = _parse_score_text(elem.get_text(strip=True))
+            
+            if team_elements_seen == 4 and score is not None:
+                break
         
         if len(teams) >= 2:
             result["home_team"] = teams[0]
             result["away_team"] = teams[1]
         
-        # Try to find score
-        score_elements = soup.find_all(['span', 'div'], class_=re.compile(r'score', re.I))
-        for elem in score_elements:
-            text = elem.get_text(strip=True)
-            if re.match(r'^\d+[:\-]\d+$', text):
-                scores = re.split(r'[:\-]', text)
-                if len(scores) == 2:
-                    result["home_score"] = int(scores[0])
-                    result["away_score"] = int(scores[1])
-                    result["status"] = "finished"
-                break
+        if score is not None:
+            result["home_score"], result["away_score"] = score
+            result["status"] = "finished"
         
         return result
 
@@ -187,15 +413,14 @@ class SofaScoreClient:
             # SofaScore API endpoint (may require authentication)
             api_url = f"{self.base_url}/api/v1/event/{match_id}"
             
-            async with await self._get_client() as client:
-                response = await client.get(api_url)
+            response = await self._get(api_url)
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                logger.warning(f"SofaScore API returned {response.status_code} for match {match_id}")
+                return {}
                 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.warning(f"SofaScore API returned {response.status_code} for match {match_id}")
-                    return {}
-                    
         except Exception as e:
             logger.error(f"Error fetching SofaScore statistics for match {match_id}: {e}")
             return {}
@@ -211,46 +436,113 @@ class SofaScoreClient:
             List of historical match dictionaries
         """
         try:
-            # Search for team
-            search_url = f"{self.base_url}/search"
-            params = {"q": team_name, "type": "team"}
-            
-            async with await self._get_client() as client:
-                response = await client.get(search_url, params=params)
-                
-                if response.status_code != 200:
-                    return []
-                
-                # Parse search results to find team ID
-                soup = BeautifulSoup(response.text, 'html.parser')
-                team_links = soup.find_all('a', href=re.compile(r'/team/'))
-                
-                if not team_links:
-                    return []
-                
-                # Get first team's URL
-                team_url = team_links[0].get('href')
-                team_id_match = re.search(r'/team/(\d+)', team_url)
-                
-                if not team_id_match:
-                    return []
-                
-                team_id = team_id_match.group(1)
-                
-                # Get team's recent matches
-                matches_url = f"{self.base_url}/api/v1/team/{team_id}/events/last/{limit}"
-                matches_response = await client.get(matches_url)
-                
-                if matches_response.status_code == 200:
-                    data = matches_response.json()
-                    return data.get('events', [])
-                
+            team_id = await self._find_team_id(team_name)
+
+            if team_id is None:
                 return []
-                
+
+            # Get team's recent matches
+            matches_url = f"{self.base_url}/api/v1/team/{team_id}/events/last/{limit}"
+            matches_response = await self._get(matches_url)
+            
+            if matches_response.status_code == 200:
+                data = orjson.loads(matches_response.content)
+                return data.get('events', [])
+            
+            return []
+            
         except Exception as e:
             logger.error(f"Error fetching historical matches for team {team_name}: {e}")
             return []
 
+    async def get_teams_historical_matches(
+        self,
+        team_names: List[str],
+        limit: int = 20
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get historical matches for several teams concurrently.
+        
+        Each team's ID lookup and events request run as one pipeline, so a
+        slow lookup for one team does not hold back the others.
+        
+        Args:
+            team_names: Team names to search for
+            limit: Maximum number of matches to return per team
+        
+        Returns:
+            Historical match dictionaries keyed by team name
+        """
+        histories = await asyncio.gather(
+            *(self.get_team_historical_matches(team_name, limit) for team_name in team_names)
+        )
+        return dict(zip(team_names, histories))
+
+    async def get_full_match_bundle(self, match_url: str, history_limit: int = 20) -> Dict[str, Any]:
+        """Get match data together with its statistics and both teams' histories.
+
+        The match page is fetched first for the match ID and team names; the
+        remaining three requests are independent and run concurrently.
+
+        Args:
+            match_url: SofaScore match URL
+            history_limit: Maximum number of historical matches per team
+
+        Returns:
+            Dictionary with match, statistics, home_history and away_history
+        """
+        match_data = await self.get_match_data(match_url)
+        match_id = match_data.get("match_id") or self.parse_match_url(match_url).get("match_id")
+
+        async def no_statistics() -> Dict[str, Any]:
+            return {}
+
+        async def no_history() -> List[Dict[str, Any]]:
+            return []
+
+        home_team = match_data.get("home_team")
+        away_team = match_data.get("away_team")
+        statistics, home_history, away_history = await asyncio.gather(
+            self.get_match_statistics(match_id) if match_id else no_statistics(),
+            self.get_team_historical_matches(home_team, history_limit) if home_team else no_history(),
+            self.get_team_historical_matches(away_team, history_limit) if away_team else no_history(),
+        )
+
+        return {
+            "match": match_data,
+            "statistics": statistics,
+            "home_history": home_history,
+            "away_history": away_history,
+        }
+
+    async def _find_team_id(self, team_name: str) -> Optional[int]:
+        """Look up a team's SofaScore ID through the JSON search API.
+
+        Results are cached per normalized team name for TEAM_ID_TTL seconds.
+        """
+        key = " ".join(team_name.lower().split())
+        cached = SofaScoreClient._team_ids.get(key)
+        if cached is not None:
+            expires_at, team_id = cached
+            if time.monotonic() < expires_at:
+                SofaScoreClient._team_ids.move_to_end(key)
+                return team_id
+            del SofaScoreClient._team_ids[key]
+
+        response = await self._get(f"{self.base_url}/api/v1/search/teams/{quote(team_name)}")
+        if response.status_code != 200:
+            return None
+
+        teams = orjson.loads(response.content).get("teams") or []
+        if not teams:
+            return None
+
+        team_id = teams[0]["id"]
+        SofaScoreClient._team_ids[key] = (time.monotonic() + self.TEAM_ID_TTL, team_id)
+        SofaScoreClient._team_ids.move_to_end(key)
+        while len(SofaScoreClient._team_ids) > self.TEAM_ID_CACHE_SIZE:
+            SofaScoreClient._team_ids.popitem(last=False)
+        return team_id
+
     def parse_match_url(self, url: str) -> Dict[str, Any]:
         """Parse SofaScore URL to extract match information.
         
@@ -260,21 +552,20 @@ class SofaScoreClient:
         Returns:
             Dictionary with parsed URL components
         """
-        parsed = urlparse(url)
-        fragment = parsed.fragment
+        path = _url_path(url)
         
         result = {
             "url": url,
-            "path": parsed.path,
+            "path": path,
         }
         
         # Extract match ID from fragment (#id:15389642)
-        id_match = re.search(r'id:(\d+)', fragment)
-        if id_match:
-            result["match_id"] = int(id_match.group(1))
+        match_id = _fragment_match_id(url.partition('#')[2])
+        if match_id is not None:
+            result["match_id"] = match_id
         
         # Extract team names from path
-        path_parts = parsed.path.strip('/').split('/')
+        path_parts = path.strip('/').split('/')
         if len(path_parts) >= 3 and path_parts[0] == 'football' and path_parts[1] == 'match':
             match_slug = path_parts[2]
             # Format: "nk-maribor-debreceni-vsc"
@@ -297,8 +588,21 @@ class SofaScoreClient:
             )
         return self._browser
 
+    async def _get_context(self) -> BrowserContext:
+        """Get or create the browser context shared by all searches."""
+        if self._context is None:
+            browser = await self._get_browser()
+            self._context = await browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=self.headers['User-Agent']
+            )
+        return self._context
+
     async def close_browser(self):
-        """Close the browser instance."""
+        """Close the browser context and instance."""
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -322,11 +626,17 @@ class SofaScoreClient:
         Returns:
             Dictionary with selected result data including URL, title, and other metadata
         """
-        browser = await self._get_browser()
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent=self.headers['User-Agent']
-        )
+        result_data, _ = await self._search_and_select(query, result_index, wait_timeout)
+        return result_data
+
+    async def _search_and_select(
+        self,
+        query: str,
+        result_index: int = 0,
+        wait_timeout: int = 10000
+    ) -> Tuple[Dict[str, Any], str]:
+        """Run search_and_select_result, also returning the selected page's HTML."""
+        context = await self._get_context()
         page = await context.new_page()
         
         try:
@@ -345,7 +655,6 @@ class SofaScoreClient:
             # Type the query into the search input
             logger.info(f"Typing query: {query}")
             await search_input.fill(query)
-            await page.wait_for_timeout(500)  # Wait a bit for search to trigger
             
             # Wait for dropdown to appear
             logger.info("Waiting for dropdown results to appear")
@@ -357,30 +666,21 @@ class SofaScoreClient:
                     state='visible'
                 )
                 
-                # Wait a bit more for results to populate
-                await page.wait_for_timeout(1000)
-                
-                # Find all clickable results in the dropdown
-                # Look for clickable items in the dropdown (could be buttons, links, or divs)
-                result_selectors = [
-                    '.z_dropdown button',
-                    '.z_dropdown a',
-                    '.z_dropdown [role="button"]',
-                    '.z_dropdown div[class*="result"]',
-                    '.z_dropdown div[class*="item"]',
-                ]
+                # Wait until results have populated
+                await page.wait_for_function(
+                    _DROPDOWN_POPULATED_SCRIPT,
+                    arg=[_DROPDOWN_RESULT_SELECTOR, _DROPDOWN_FALLBACK_SELECTOR],
+                    timeout=wait_timeout,
+                )
                 
-                results = []
-                for selector in result_selectors:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        results = elements
-                        logger.info(f"Found {len(results)} results using selector: {selector}")
-                        break
+                # Find all clickable results in the dropdown in one query
+                results = await page.query_selector_all(_DROPDOWN_RESULT_SELECTOR)
+                if results:
+                    logger.info(f"Found {len(results)} results in dropdown")
                 
                 if not results:
                     # Fallback: try to find any clickable element in dropdown
-                    results = await page.query_selector_all('.z_dropdown > * > *')
+                    results = await page.query_selector_all(_DROPDOWN_FALLBACK_SELECTOR)
                     logger.info(f"Fallback: Found {len(results)} results in dropdown")
                 
                 if not results:
@@ -403,38 +703,37 @@ class SofaScoreClient:
                     "total_results": len(results),
                 }
                 
-                # Try to extract text content
-                text_content = await selected_result.text_content()
+                # Read text, href and data attributes in one browser round trip
+                result_info = await selected_result.evaluate(_RESULT_INFO_SCRIPT)
+                
+                text_content = result_info["text"]
                 if text_content:
                     result_data["text"] = text_content.strip()
                 
-                # Try to extract href if it's a link
-                href = await selected_result.get_attribute('href')
+                # Include the URL if it's a link
+                href = result_info["href"]
                 if href:
                     result_data["url"] = href if href.startswith('http') else f"{self.base_url}{href}"
                 
-                # Try to extract data attributes
-                data_attrs = await selected_result.evaluate("""
-                    (element) => {
-                        const attrs = {};
-                        for (let attr of element.attributes) {
-                            if (attr.name.startsWith('data-')) {
-                                attrs[attr.name] = attr.value;
-                            }
-                        }
-                        return attrs;
-                    }
-                """)
+                data_attrs = result_info["data"]
                 if data_attrs:
                     result_data["data_attributes"] = data_attrs
                 
                 logger.info(f"Selecting result {result_index}: {result_data.get('text', 'N/A')}")
                 
                 # Click on the selected result
+                previous_url = page.url
                 await selected_result.click()
                 
-                # Wait for navigation or page update
-                await page.wait_for_timeout(2000)
+                # Wait for navigation; results that don't navigate give up after a short bound
+                try:
+                    await page.wait_for_url(
+                        lambda url: url != previous_url,
+                        timeout=self.SELECTION_NAVIGATION_TIMEOUT,
+                    )
+                except PlaywrightTimeoutError:
+                    logger.info("Selected result did not navigate; reading the current page")
+                await page.wait_for_load_state('domcontentloaded')
                 
                 # Get the current URL after selection
                 current_url = page.url
@@ -446,7 +745,7 @@ class SofaScoreClient:
                 
                 logger.info(f"Successfully selected result. Final URL: {current_url}")
                 
-                return result_data
+                return result_data, page_content
                 
             except PlaywrightTimeoutError:
                 logger.error(f"Timeout waiting for dropdown results for query: {query}")
@@ -456,7 +755,7 @@ class SofaScoreClient:
             logger.error(f"Error during search and select for query '{query}': {e}", exc_info=True)
             raise
         finally:
-            await context.close()
+            await page.close()
 
     async def search_and_get_match_data(
         self,
@@ -476,42 +775,24 @@ class SofaScoreClient:
             Dictionary with match/team data extracted from the selected result page
         """
         try:
-            # Perform search and selection
-            search_result = await self.search_and_select_result(query, result_index)
+            # Perform search and selection; its page HTML is parsed directly
+            search_result, page_content = await self._search_and_select(query, result_index)
+            final_url = search_result.get("final_url", self.base_url)
             
-            # Extract data from the resulting page
-            browser = await self._get_browser()
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent=self.headers['User-Agent']
-            )
-            page = await context.new_page()
+            # Try to extract match data using existing methods
+            match_data = self._extract_json_data(page_content)
             
-            try:
-                final_url = search_result.get("final_url", self.base_url)
-                await page.goto(final_url, wait_until='networkidle', timeout=self.timeout * 1000)
-                
-                # Get page content and parse it
-                page_content = await page.content()
-                soup = BeautifulSoup(page_content, 'html.parser')
-                
-                # Try to extract match data using existing methods
-                match_data = self._extract_json_data(soup, page_content)
-                
-                if not match_data:
-                    match_data = self._parse_html_structure(soup, final_url)
-                
-                # Merge search result metadata with extracted data
-                match_data.update({
-                    "search_query": query,
-                    "search_result_index": result_index,
-                    "source_url": final_url,
-                })
-                
-                return match_data
-                
-            finally:
-                await context.close()
+            if not match_data:
+                match_data = self._parse_html_structure(page_content, final_url)
+            
+            # Merge search result metadata with extracted data
+            match_data.update({
+                "search_query": query,
+                "search_result_index": result_index,
+                "source_url": final_url,
+            })
+            
+            return match_data
                 
         except Exception as e:
             logger.error(f"Error in search_and_get_match_data for query '{query}': {e}", exc_info=True)
@@ -29,6 +29,10 @@ class SportsMonksClient(APIClient):
             rate_limit_per_minute=60,  # Adjust based on your plan
         )
 
+    def _default_headers(self) -> Dict[str, str]:
+        """SportsMonks authenticates with a query parameter, not a header."""
+        return {}
+
     async def _make_request(
         self,
         method: str,
@@ -49,12 +53,6 @@ class SportsMonksClient(APIClient):
         if self.api_key:
             params["api_token"] = self.api_key
         
-        # Prevent base class from adding API key as header by passing a dummy header
-        if headers is None:
-            headers = {}
-        # Set a dummy value to prevent base class from adding X-API-Key header
-        headers["X-API-Key"] = ""
-        
         # Call parent's _make_request
         return await super()._make_request(
             method=method,
@@ -0,0 +1,46 @@
+"""Request pacing and retry backoff shared by the scraping and AI clients."""
+
+import asyncio
+import random
+import time
+
+
+class RequestPacer:
+    """Space request starts at least 1/rate seconds apart.
+
+    One pacer is shared by every client instance talking to the same host,
+    so concurrent callers stay under the provider's request rate.
+    """
+
+    def __init__(self, requests_per_second: float):
+        """Initialize pacer.
+
+        Args:
+            requests_per_second: Maximum request starts per second
+        """
+        self.interval = 1.0 / requests_per_second
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Wait until the next request may start."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def jittered_backoff(attempt: int, base: float, cap: float) -> float:
+    """Compute a retry wait using capped exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Wait ceiling for the first retry, in seconds
+        cap: Upper bound on any wait, in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(base * (2 ** attempt), cap))
@@ -43,7 +43,6 @@ class APIKeyRepository:
         )
         self.db.add(db_key)
         await self.db.commit()
-        await self.db.refresh(db_key)
         return db_key
 
     async def get_by_hash(self, key_hash: str) -> Optional[APIKeyModel]:
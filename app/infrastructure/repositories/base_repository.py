@@ -1,6 +1,6 @@
 """Base repository implementation."""
 
-from typing import Generic, TypeVar, Optional, List, Type
+from typing import Any, Generic, TypeVar, Optional, List, Tuple, Type
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update
 
@@ -11,12 +11,19 @@ M = TypeVar("M")
 class BaseRepository(Generic[T, M]):
     """Base repository implementation."""
 
+    # Loader options (e.g. selectinload) applied to every query built by _select
+    loader_options: Tuple[Any, ...] = ()
+
     def __init__(self, session: AsyncSession, model: Type[M], entity_class: Type[T]):
         """Initialize repository with session and model."""
         self.session = session
         self.model = model
         self.entity_class = entity_class
 
+    def _select(self):
+        """Build a SELECT for the model with the repository's loader options."""
+        return select(self.model).options(*self.loader_options)
+
     def _model_to_entity(self, model: M) -> T:
         """Convert database model to domain entity."""
         raise NotImplementedError("Subclasses must implement _model_to_entity")
@@ -29,14 +36,14 @@ class BaseRepository(Generic[T, M]):
         """Create a new entity."""
         model = self._entity_to_model(entity)
         self.session.add(model)
+        # eager_defaults fetches server-generated columns during the flush
         await self.session.flush()
-        await self.session.refresh(model)
         return self._model_to_entity(model)
 
     async def get_by_id(self, entity_id: int) -> Optional[T]:
         """Get entity by ID."""
         result = await self.session.execute(
-            select(self.model).where(self.model.id == entity_id)
+            self._select().where(self.model.id == entity_id)
         )
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
@@ -44,7 +51,7 @@ class BaseRepository(Generic[T, M]):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all entities with pagination."""
         result = await self.session.execute(
-            select(self.model).offset(skip).limit(limit)
+            self._select().offset(skip).limit(limit)
         )
         models = result.scalars().all()
         return [self._model_to_entity(model) for model in models]
@@ -54,10 +61,8 @@ class BaseRepository(Generic[T, M]):
         if not entity.id:
             raise ValueError("Entity must have an ID to update")
         
-        model = self._entity_to_model(entity)
-        await self.session.merge(model)
+        model = await self.session.merge(self._entity_to_model(entity))
         await self.session.flush()
-        await self.session.refresh(model)
         return self._model_to_entity(model)
 
     async def delete(self, entity_id: int) -> bool:
@@ -2,7 +2,8 @@
 
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import or_
+from sqlalchemy.orm import selectinload
 
 from app.domain.entities.team import Team
 from app.domain.repositories.team_repository import ITeamRepository
@@ -13,6 +14,9 @@ from app.infrastructure.repositories.base_repository import BaseRepository
 class TeamRepository(BaseRepository[Team, TeamModel], ITeamRepository):
     """Team repository implementation."""
 
+    # _model_to_entity reads the league; load it for all rows in one query
+    loader_options = (selectinload(TeamModel.league),)
+
     def __init__(self, session: AsyncSession):
         """Initialize team repository."""
         super().__init__(session, TeamModel, Team)
@@ -54,7 +58,7 @@ class TeamRepository(BaseRepository[Team, TeamModel], ITeamRepository):
     async def get_by_sport(self, sport: str) -> List[Team]:
         """Get all teams for a sport."""
         result = await self.session.execute(
-            select(self.model).where(self.model.sport == sport)
+            self._select().where(self.model.sport == sport)
         )
         models = result.scalars().all()
         return [self._model_to_entity(model) for model in models]
@@ -62,7 +66,7 @@ class TeamRepository(BaseRepository[Team, TeamModel], ITeamRepository):
     async def get_by_league(self, league: str) -> List[Team]:
         """Get all teams in a league."""
         result = await self.session.execute(
-            select(self.model).where(self.model.league == league)
+            self._select().where(self.model.league == league)
         )
         models = result.scalars().all()
         return [self._model_to_entity(model) for model in models]
@@ -70,7 +74,7 @@ class TeamRepository(BaseRepository[Team, TeamModel], ITeamRepository):
     async def get_by_code(self, code: str) -> Optional[Team]:
         """Get team by code."""
         result = await self.session.execute(
-            select(self.model).where(self.model.code == code)
+            self._select().where(self.model.code == code)
         )
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
@@ -79,7 +83,7 @@ class TeamRepository(BaseRepository[Team, TeamModel], ITeamRepository):
         """Search teams by name or other criteria."""
         search_pattern = f"%{query}%"
         result = await self.session.execute(
-            select(self.model)
+            self._select()
             .where(
                 or_(
                     self.model.name.ilike(search_pattern),
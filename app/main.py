@@ -1,5 +1,6 @@
 """Main application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +11,8 @@ from app.core.logging_config import setup_logging
 from app.api.v1.router import api_router
 from app.core.middleware import setup_middleware
 from app.infrastructure.cache.redis_client import redis_client
+from app.infrastructure.cache.cache_manager import cache_manager
+from app.infrastructure.external.sofascore_client import SofaScoreClient
 
 
 @asynccontextmanager
@@ -22,10 +25,18 @@ async def lifespan(app: FastAPI):
         json_format=True,
     )
     
-    await redis_client.get_client()
+    if await redis_client.get_client() is None:
+        # Serve from memory right away; the health check reconnects later
+        cache_manager.enable_fallback()
+
+    # Resolve DNS and open the SofaScore connection in the background
+    sofascore_warmup = asyncio.create_task(SofaScoreClient().warm_up())
     yield
     # Shutdown
+    sofascore_warmup.cancel()
+    await cache_manager.close()
     await redis_client.close()
+    await SofaScoreClient.aclose()
 
 
 def create_application() -> FastAPI:
@@ -0,0 +1,96 @@
+"""Unit tests for the cache manager in-memory tier."""
+
+import pytest
+
+from app.infrastructure.cache.cache_manager import CacheManager, CacheType
+from app.infrastructure.cache.redis_client import redis_client
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Cache manager with Redis unavailable."""
+    async def no_client():
+        return None
+
+    monkeypatch.setattr(redis_client, "get_client", no_client)
+    manager = CacheManager()
+    manager._redis_ok = False
+    return manager
+
+
+class TestMemoryCache:
+    """Tests for the in-memory fallback tier."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_roundtrip(self, manager):
+        """Test values are returned decoded from the memory tier."""
+        value = {"id": 1, "teams": ["home", "away"]}
+        await manager.set(CacheType.GENERAL, "match", value)
+
+        assert await manager.get(CacheType.GENERAL, "match") == value
+        assert await manager.exists(CacheType.GENERAL, "match")
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_separate_per_cache_type(self, manager):
+        """Test clearing one cache type leaves the others intact."""
+        await manager.set(CacheType.LIVE_MATCHES, "a", 1)
+        await manager.set(CacheType.HISTORICAL_DATA, "a", 2)
+
+        await manager.clear(CacheType.LIVE_MATCHES)
+
+        assert await manager.get(CacheType.LIVE_MATCHES, "a") is None
+        assert await manager.get(CacheType.HISTORICAL_DATA, "a") == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, manager, monkeypatch):
+        """Test least recently used entries are evicted beyond capacity."""
+        monkeypatch.setitem(CacheManager.MEMORY_CACHE_SIZE, CacheType.GENERAL, 2)
+
+        await manager.set(CacheType.GENERAL, "a", 1)
+        await manager.set(CacheType.GENERAL, "b", 2)
+        await manager.get(CacheType.GENERAL, "a")
+        await manager.set(CacheType.GENERAL, "c", 3)
+
+        assert await manager.get(CacheType.GENERAL, "a") == 1
+        assert await manager.get(CacheType.GENERAL, "b") is None
+        assert await manager.get(CacheType.GENERAL, "c") == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_pattern(self, manager):
+        """Test pattern deletion removes matching keys only."""
+        await manager.set(CacheType.HISTORICAL_DATA, "league:1", 1)
+        await manager.set(CacheType.HISTORICAL_DATA, "team:1", 2)
+
+        await manager.delete_pattern(CacheType.HISTORICAL_DATA, "league:*")
+
+        assert await manager.get(CacheType.HISTORICAL_DATA, "league:1") is None
+        assert await manager.get(CacheType.HISTORICAL_DATA, "team:1") == 2
+
+    @pytest.mark.asyncio
+    async def test_set_many_and_get_many(self, manager):
+        """Test batch operations return only the keys that were cached."""
+        await manager.set_many(CacheType.API_RESPONSE, {"a": 1, "b": [2, 3]})
+
+        result = await manager.get_many(CacheType.API_RESPONSE, ["a", "b", "c"])
+
+        assert result == {"a": 1, "b": [2, 3]}
+
+    @pytest.mark.asyncio
+    async def test_get_on_hash_or_stream_is_a_miss(self, manager):
+        """Test plain reads of hash and stream keys miss, as they do in Redis."""
+        await manager.hset_many(CacheType.LIVE_MATCHES, "live", {"1": {"status": "live"}})
+        await manager.xadd(CacheType.LIVE_MATCHES, "events:1", {"score": 1}, maxlen=3)
+
+        assert await manager.get(CacheType.LIVE_MATCHES, "live") is None
+        assert await manager.get(CacheType.LIVE_MATCHES, "events:1") is None
+        assert await manager.get_many(CacheType.LIVE_MATCHES, ["live", "events:1"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_keeps_latest_events(self, manager):
+        """Test streams return the newest events first and stay capped."""
+        for score in range(5):
+            await manager.xadd(CacheType.LIVE_MATCHES, "events:1", {"score": score}, maxlen=3)
+
+        events = await manager.xrevrange_many(CacheType.LIVE_MATCHES, ["events:1", "events:2"], count=5)
+
+        assert events == {"events:1": [{"score": 4}, {"score": 3}, {"score": 2}]}
@@ -0,0 +1,52 @@
+"""Unit tests for the live matches cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.infrastructure.cache import live_matches_cache
+from app.infrastructure.cache.cache_manager import CacheManager
+from app.infrastructure.cache.live_matches_cache import LiveMatchesCache
+
+
+@pytest.fixture(autouse=True)
+def manager(monkeypatch):
+    """Fresh cache manager with Redis unavailable."""
+    manager = CacheManager()
+    manager._redis_ok = False
+    monkeypatch.setattr(live_matches_cache, "cache_manager", manager)
+    return manager
+
+
+class TestStatusOverlay:
+    """Tests for applying status events to cached live matches."""
+
+    @pytest.mark.asyncio
+    async def test_newer_event_is_applied(self):
+        """Test the latest event overrides an older cached entry."""
+        an_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        await LiveMatchesCache.set_live_matches([
+            {"id": 1, "status": "1H", "home_score": 0, "updated_at": an_hour_ago},
+            {"id": 2, "status": "HT"},
+        ])
+
+        await LiveMatchesCache.update_match_status(1, "2H", {"home_score": 1})
+        matches = {match["id"]: match for match in await LiveMatchesCache.get_live_matches()}
+
+        assert matches[1]["status"] == "2H"
+        assert matches[1]["home_score"] == 1
+        assert matches[2] == {"id": 2, "status": "HT"}
+
+    @pytest.mark.asyncio
+    async def test_event_older_than_entry_is_skipped(self):
+        """Test an event from before the entry was refreshed is ignored."""
+        await LiveMatchesCache.update_match_status(1, "1H", {"home_score": 0})
+        refreshed_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+        await LiveMatchesCache.set_live_matches([
+            {"id": 1, "status": "FT", "home_score": 2, "updated_at": refreshed_at},
+        ])
+
+        [match] = await LiveMatchesCache.get_live_matches()
+
+        assert match["status"] == "FT"
+        assert match["home_score"] == 2
@@ -0,0 +1,148 @@
+"""Unit tests for SofaScore page parsing."""
+
+import json
+import re
+from urllib.parse import urlparse
+
+import pytest
+from bs4 import BeautifulSoup
+
+pytest.importorskip("playwright")
+
+from app.infrastructure.external.sofascore_client import (
+    SofaScoreClient,
+    _fragment_match_id,
+    _parse_score_text,
+    _url_path,
+)
+
+
+@pytest.fixture
+def client():
+    """SofaScore client; parsing never touches the network."""
+    return SofaScoreClient()
+
+
+class TestExtractJsonData:
+    """Tests for embedded JSON extraction."""
+
+    def test_initial_state_event_is_used(self, client):
+        """Test the inline page state wins when it carries an event."""
+        html = (
+            '<script>window.__INITIAL_STATE__ = {"event": {"id": 7, '
+            '"homeTeam": {"name": "Arsenal"}, "awayTeam": {"name": "Chelsea"}}};</script>'
+        )
+
+        data = client._extract_json_data(html)
+
+        assert data["match_id"] == 7
+        assert data["home_team"] == "Arsenal"
+
+    def test_initial_state_without_event_falls_through_to_json_ld(self, client):
+        """Test JSON-LD is still tried when the page state has no event."""
+        html = (
+            '<script>window.__INITIAL_STATE__ = {"user": null};</script>'
+            '<script type="application/ld+json">{"@type": "SportsEvent", '
+            '"identifier": {"value": "42"}, "homeTeam": {"name": "Arsenal"}, '
+            '"awayTeam": {"name": "Chelsea"}}</script>'
+        )
+
+        data = client._extract_json_data(html)
+
+        assert data["match_id"] == "42"
+        assert data["away_team"] == "Chelsea"
+
+
+def _regex_fragment_match_id(fragment):
+    """Match ID as the former id:(\\d+) regex read it."""
+    found = re.search(r'id:(\d+)', fragment)
+    return int(found.group(1)) if found else None
+
+
+def _regex_score(text):
+    """Score as the former ^(\\d+)[:\\-](\\d+)$ regex read it."""
+    found = re.match(r'^(\d+)[:\-](\d+)$', text)
+    return (int(found.group(1)), int(found.group(2))) if found else None
+
+
+def _soup_json_ld_event(html):
+    """SportsEvent as found by decoding every JSON-LD script in a parsed tree."""
+    for script in BeautifulSoup(html, "html.parser").find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.get_text())
+        except ValueError:
+            continue
+        if isinstance(data, dict) and data.get("@type") == "SportsEvent":
+            return data
+    return None
+
+
+_EVENT = '{"@type": "SportsEvent", "identifier": {"value": "1"}}'
+
+
+class TestStringHelpers:
+    """Tests pinning the str-method parsers to the regex/urllib behaviour they replaced."""
+
+    @pytest.mark.parametrize("fragment, expected", [
+        ("id:15389642", 15389642),
+        ("tab:statistics,id:12", 12),
+        ("#foo,id:12", 12),
+        ("id:12abc", 12),
+        ("id:", None),
+        ("id:abc", None),
+        ("id:abc,id:34", 34),
+        ("", None),
+        ("ID:12", None),
+    ])
+    def test_fragment_match_id(self, fragment, expected):
+        """Test the match ID is read from the first id: followed by digits."""
+        assert _fragment_match_id(fragment) == expected
+        assert _fragment_match_id(fragment) == _regex_fragment_match_id(fragment)
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://www.sofascore.com/arsenal-chelsea/abc#id:12", "/arsenal-chelsea/abc"),
+        ("https://www.sofascore.com/football/match?tab=stats", "/football/match"),
+        ("https://www.sofascore.com/football/match/?q=1#id:2", "/football/match/"),
+        ("https://www.sofascore.com", ""),
+        ("https://www.sofascore.com?q=1", ""),
+        ("https://www.sofascore.com#id:12", ""),
+        ("/football/match?q=1", "/football/match"),
+        ("www.sofascore.com/match", "www.sofascore.com/match"),
+    ])
+    def test_url_path(self, url, expected):
+        """Test the path matches urlparse with no path, a query or a fragment."""
+        assert _url_path(url) == expected
+        assert _url_path(url) == urlparse(url).path
+
+    @pytest.mark.parametrize("text, expected", [
+        ("2-1", (2, 1)),
+        ("2:1", (2, 1)),
+        ("10:0", (10, 0)),
+        ("2 - 1", None),
+        ("2:1-0", None),
+        ("-1", None),
+        ("2-", None),
+        ("2", None),
+        ("", None),
+        ("a-b", None),
+    ])
+    def test_parse_score_text(self, text, expected):
+        """Test scores split on ':' or '-' with digits on both sides only."""
+        assert _parse_score_text(text) == expected
+        assert _parse_score_text(text) == _regex_score(text)
+
+    @pytest.mark.parametrize("html", [
+        f'<script type="application/ld+json">{_EVENT}</script>',
+        f'<script type="application/ld+json">{{"@type": "Organization"}}</script>'
+        f'<script type="application/ld+json">{_EVENT}</script>',
+        f'<script type="application/ld+json">not json</script>'
+        f'<script type="application/ld+json">{_EVENT}</script>',
+        f'<script>var type = "application/ld+json";</script>'
+        f'<script type="application/ld+json">{_EVENT}</script>',
+        f'<script>{_EVENT}</script>',
+        '<script type="application/ld+json">[1, 2]</script>',
+        '<p>no scripts</p>',
+    ])
+    def test_find_json_ld_event(self, html):
+        """Test the raw scan finds the same event as a parsed tree."""
+        assert SofaScoreClient._find_json_ld_event(html) == _soup_json_ld_event(html)